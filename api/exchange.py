@@ -1,19 +1,42 @@
 from __future__ import annotations
-from typing import Any, Dict
-from fastapi import APIRouter
-from pydantic import BaseModel
+from typing import Any, Dict, List
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.concurrency import run_in_threadpool
 
-from omp_ref_server.models import OMPEnvelope, OMP_VERSION
+from omp_ref_server.api.bodies import decode_body, json_body
+from omp_ref_server.config import settings
+from omp_ref_server.models import ENVELOPE_ADAPTER, OMPEnvelope, OMP_VERSION
+from omp_ref_server.security.envelopes import verify_envelope, verify_envelopes
 
 router = APIRouter(prefix="/exchange", tags=["exchange"])
 
+# Envelopes are validated straight from the request bytes
+_ENVELOPE = ENVELOPE_ADAPTER
+_ENVELOPES = TypeAdapter(List[OMPEnvelope])
+
 class ExchangeResult(BaseModel):
     status: str = "ok"
     omp_version: str = OMP_VERSION
     verify: Dict[str, bool] = {"sig_ok": False, "hash_ok": False}
 
-@router.post("", response_model=ExchangeResult)
-def exchange(envelope: OMPEnvelope) -> ExchangeResult:
-    # Stub: we just acknowledge and return placeholders.
-    # Later we’ll compute content_hash + verify the detached signature.
-    return ExchangeResult()
+@router.post("", response_model=ExchangeResult, openapi_extra=json_body(_ENVELOPE))
+async def exchange(request: Request) -> ExchangeResult:
+    envelope: OMPEnvelope = decode_body(_ENVELOPE, await request.body())
+    # Acknowledge and report integrity; delivery/storage comes later.
+    return ExchangeResult(verify=verify_envelope(envelope))
+
+@router.post("/batch", response_model=List[ExchangeResult], openapi_extra=json_body(_ENVELOPES))
+async def exchange_batch(request: Request) -> ORJSONResponse:
+    envelopes: List[OMPEnvelope] = decode_body(_ENVELOPES, await request.body())
+    if len(envelopes) > settings.EXCHANGE_BATCH_MAX:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"batch too large (max {settings.EXCHANGE_BATCH_MAX})",
+        )
+    # Ed25519 verification is CPU-bound: keep it off the event loop
+    results = await run_in_threadpool(verify_envelopes, envelopes)
+    # plain dicts in one orjson call; per-item ExchangeResult models and
+    # response_model re-validation cost more than the verify itself
+    return ORJSONResponse([{"status": "ok", "omp_version": OMP_VERSION, "verify": v} for v in results])
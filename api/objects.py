@@ -1,128 +1,189 @@
 # api/objects.py
-import os
-from typing import Optional, Dict, Any, List, Any as AnyType
-from datetime import datetime
+import hashlib
+from typing import Optional, Dict, Any, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+import orjson
+from pydantic import TypeAdapter
 
 
+from omp_ref_server.api.bodies import decode_body, json_body
+from omp_ref_server.config import settings
 from omp_ref_server.security.signatures import signature_dependency
-
-# --- 7.1 ---
-
-def verify_signature_dependency(request: Request):
-    """
-    7.1a — syntax-only gate.
-    Modes:
-      - off:        do nothing
-      - permissive: try-parse if headers exist; never block
-      - strict:     require Signature-Input and Signature; parse or 400; missing -> 401
-    """
-    mode = get_sig_mode()
-    if mode == SigMode.OFF:
-        return True
-
-    sig_input = request.headers.get("signature-input")
-    sig = request.headers.get("signature")
-
-    if mode == SigMode.STRICT:
-        if not sig_input or not sig:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing HTTP Message Signatures")
-        try:
-            parse_signature_input(sig_input)
-            parse_signature(sig)
-        except ValueError as e:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Malformed signature: {e}")
-        return True
-
-    # PERMISSIVE
-    if sig_input and sig:
-        try:
-            parse_signature_input(sig_input)
-            parse_signature(sig)
-        except ValueError:
-            # log-only in 7.1a; don’t block
-            pass
-    return True
+# Contracts live in the models package; re-exported here for existing imports
+from omp_ref_server.models.objects import (
+    ObjectIn,
+    ObjectOut,
+    ObjectDataOut,
+    ObjectListOut,
+    ObjectUpdateIn,
+)
+from omp_ref_server.ports.storage import StoragePort
+from omp_ref_server.infra.providers import get_storage
+from omp_ref_server.utils.response_cache import ResponseCache
 
 router = APIRouter(
     prefix="/objects",
     tags=["objects"],
-    dependencies=[Depends(signature_dependency)]
+    dependencies=[Depends(signature_dependency)],
+    default_response_class=ORJSONResponse,
 )
 
-# --- Pydantic contracts ---
-class ObjectIn(BaseModel):
-    namespace: str = Field(..., description="Logical bucket / tenant / space")
-    key: Optional[str] = Field(None, description="Caller-supplied key; generate if absent")
-    content: Dict[str, Any] = Field(..., description="Arbitrary structured payload")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
-
-class ObjectOut(BaseModel):
-    id: str
-    namespace: str
-    key: str
-    created_at: datetime
-    metadata: Dict[str, Any]
-
-class ObjectDataOut(BaseModel):
-    id: str
-    namespace: str
-    key: str
-    created_at: datetime
-    metadata: Dict[str, Any]
-    content: Dict[str, Any]
-
-class ObjectListOut(BaseModel):
-    count: int
-    items: List[ObjectOut]
-
-class ObjectUpdateIn(BaseModel):
-    content: AnyType = Field(..., description="New full content to replace the current one")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
-
-# Import the Port and the provider
-from omp_ref_server.ports.storage import StoragePort
-from omp_ref_server.infra.providers import get_storage
+# --- Body decoding ---
+# Write bodies are validated from raw bytes (see omp_ref_server.api.bodies).
+# Adapters are built once here.
+_OBJECT_IN = TypeAdapter(ObjectIn)
+_OBJECT_UPDATE_IN = TypeAdapter(ObjectUpdateIn)
+
+
+def _fast_object_in(raw: bytes) -> Tuple[str, Optional[str], Dict[str, Any], Dict[str, Any]]:
+    """OMP_FAST_INGEST decoder: orjson + the type checks storage relies on."""
+    try:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON body")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be an object")
+    namespace, key, content = body.get("namespace"), body.get("key"), body.get("content")
+    metadata = body.get("metadata") or {}
+    if not isinstance(namespace, str) or not isinstance(content, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="namespace (string) and content (object) are required")
+    if (key is not None and not isinstance(key, str)) or not isinstance(metadata, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="key must be a string and metadata an object")
+    return namespace, key, content, metadata
+
+
+# --- Response encoding ---
+# Response DTOs are dataclasses that orjson serializes directly; handlers
+# return encoded bytes and bypass response_model validation (schema only).
+# OPT_UTC_Z keeps the "...Z" timestamps Pydantic used to emit.
+_ORJSON_OPTS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+_dumps = orjson.dumps
+
+
+def _encode(obj: Any) -> bytes:
+    return _dumps(obj, option=_ORJSON_OPTS)
+
+
+def _encode_list(out: ObjectListOut) -> bytes:
+    # Hot path for list/search: plain dicts with the field order spelled out
+    # encode ~2x faster than orjson's generic (slotted) dataclass walk.
+    return _dumps(
+        {
+            "count": out.count,
+            "items": [
+                {
+                    "id": i.id,
+                    "namespace": i.namespace,
+                    "key": i.key,
+                    "created_at": i.created_at,
+                    "metadata": i.metadata,
+                }
+                for i in out.items
+            ],
+            "cursor": out.cursor,
+        },
+        option=_ORJSON_OPTS,
+    )
+
+
+def _json(obj: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    return Response(content=_encode(obj), media_type="application/json", status_code=status_code)
+
+
+def _json_list(out: ObjectListOut) -> Response:
+    return Response(content=_encode_list(out), media_type="application/json")
+
+# --- GET response cache ---
+# Adapters may expose a `response_cache` (omp_ref_server.utils.response_cache)
+# that they invalidate on their own update/delete; get_object uses it when
+# present. Delete-on-read objects are never cached.
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # weak comparison (If-None-Match semantics): W/ prefixes are ignored
+    if not if_none_match:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def _object_response(request: Request, etag: str, body: bytes) -> Response:
+    headers = {"ETag": etag}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # --- Routes (static before dynamic) ---
 
-@router.post("", response_model=ObjectOut, status_code=status.HTTP_201_CREATED)
-def create_object(body: ObjectIn, storage: StoragePort = Depends(get_storage)) -> ObjectOut:
+@router.post(
+    "",
+    response_model=ObjectOut,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body(_OBJECT_IN),
+)
+async def create_object(request: Request, storage: StoragePort = Depends(get_storage)) -> Response:
+    raw = await request.body()
+    if settings.FAST_INGEST:
+        args = _fast_object_in(raw)
+    else:
+        body: ObjectIn = decode_body(_OBJECT_IN, raw)
+        args = (body.namespace, body.key, body.content, body.metadata or {})
     try:
-        return storage.store(body.namespace, body.key, body.content, body.metadata or {})
+        out = storage.store(*args)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Store failed")
+    return _json(out, status.HTTP_201_CREATED)
 
 @router.get("", response_model=ObjectListOut)
-def list_objects(
+async def list_objects(
     limit: int = 50,
     cursor: Optional[str] = None,
     storage: StoragePort = Depends(get_storage),
-) -> ObjectListOut:
+) -> Response:
     try:
-        return storage.list(limit=limit, cursor=cursor)
+        out = storage.list(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="List failed")
+    # storage output is already an ObjectListOut: skip response_model re-validation
+    return _json_list(out)
 
 @router.get("/search", response_model=ObjectListOut)
-def search_objects(
+async def search_objects(
     namespace: Optional[str] = None,
     key_contains: Optional[str] = None,
     limit: int = 50,
     cursor: Optional[str] = None,
     storage: StoragePort = Depends(get_storage),
-) -> ObjectListOut:
+) -> Response:
     try:
-        return storage.search(namespace=namespace, key_contains=key_contains, limit=limit, cursor=cursor)
+        out = storage.search(namespace=namespace, key_contains=key_contains, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Search failed")
+    return _json_list(out)
 
 @router.get("/{object_id}", response_model=ObjectDataOut)
-def get_object(object_id: str, storage: StoragePort = Depends(get_storage)) -> ObjectDataOut:
+async def get_object(
+    object_id: str,
+    request: Request,
+    storage: StoragePort = Depends(get_storage),
+) -> Response:
+    # env default (optional): OMP_DELETE_ON_READ_DEFAULT=1 to force delete after GET
+    delete_on_read = settings.DELETE_ON_READ_DEFAULT
+
+    cache: Optional[ResponseCache] = getattr(storage, "response_cache", None)
+    if cache is not None and not delete_on_read:
+        hit = cache.get(object_id)
+        if hit is not None:
+            return _object_response(request, *hit)
+
     try:
         obj = storage.get(object_id)
     except KeyError:
@@ -131,9 +192,6 @@ def get_object(object_id: str, storage: StoragePort = Depends(get_storage)) -> O
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Get failed")
 
     # --- erasable memory: delete-on-read ---
-    # env default (optional): OMP_DELETE_ON_READ_DEFAULT=1 to force delete after GET
-    delete_on_read = os.getenv("OMP_DELETE_ON_READ_DEFAULT", "0") == "1"
-
     md = getattr(obj, "metadata", None)
     if isinstance(md, dict):
         dor = md.get("omp.delete_on_read")
@@ -147,28 +205,36 @@ def get_object(object_id: str, storage: StoragePort = Depends(get_storage)) -> O
             pass
     # --- end erasable memory ---
 
-    return obj
+    body = _encode(obj)
+    # weak: GZipMiddleware may send this body gzip-encoded under the same tag,
+    # and a strong validator would have to differ per content-coding
+    etag = 'W/"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+    if cache is not None and not delete_on_read:
+        cache.put(object_id, (etag, body))
+    return _object_response(request, etag, body)
 
 
-@router.put("/{object_id}", response_model=ObjectOut)
-def update_object(
+@router.put("/{object_id}", response_model=ObjectOut, openapi_extra=json_body(_OBJECT_UPDATE_IN))
+async def update_object(
     object_id: str,
-    body: ObjectUpdateIn,
+    request: Request,
     storage: StoragePort = Depends(get_storage),
-) -> ObjectOut:
+) -> Response:
+    body: ObjectUpdateIn = decode_body(_OBJECT_UPDATE_IN, await request.body())
     if not isinstance(body.content, dict):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="content must be an object")
     try:
-        return storage.update(object_id, body.content, body.metadata or {})
+        out = storage.update(object_id, body.content, body.metadata or {})
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Object not found")
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Update failed")
+    return _json(out)
 
 @router.delete("/{object_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_object(object_id: str, storage: StoragePort = Depends(get_storage)) -> Response:
+async def delete_object(object_id: str, storage: StoragePort = Depends(get_storage)) -> Response:
     try:
         storage.delete(object_id)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
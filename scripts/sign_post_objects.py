@@ -14,13 +14,26 @@ Usage:
     --keyid sig1 \
     --namespace ns \
     --json '{"x":1}'
+
+  # 3) repeat it N times over one pooled connection (prints a summary)
+  python scripts/sign_post_objects.py --seed-b64u "$SEED_B64U" --count 100
+
+  # 4) time N local signatures only (no network)
+  python scripts/sign_post_objects.py --seed-b64u "$SEED_B64U" --bench --count 10000
 """
-import os, sys, json, time, base64, argparse
+import os, sys, time, base64, argparse
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from nacl.signing import SigningKey
 
+# One session per process: keep-alive connections are reused across POSTs
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=32))
+
 def b64u(b: bytes) -> str:
-    return base64.urlsafe_b64encode(b).decode().rstrip("=")
+    return base64.urlsafe_b64encode(b).rstrip(b"=").decode("ascii")
 
 def b64u_decode(s: str) -> bytes:
     s = (s or "").strip()
@@ -46,6 +59,8 @@ def main():
     ap.add_argument("--keyid", default="sig1")
     ap.add_argument("--namespace", default="ns")
     ap.add_argument("--json", default='{"x":1}')
+    ap.add_argument("--count", type=int, default=1, help="number of POSTs to send (or signatures with --bench)")
+    ap.add_argument("--bench", action="store_true", help="time sk.sign() only; send nothing")
     ap.add_argument("--gen-key", action="store_true")
     args = ap.parse_args()
 
@@ -62,10 +77,21 @@ def main():
         print("SEED_B64U must decode to 32 bytes.", file=sys.stderr)
         return 2
 
+    # built once: SigningKey keeps the expanded secret key for every sign()
     sk = SigningKey(seed)
 
     full = f"{args.host.rstrip('/')}{args.path}"
     base = f"POST {full}".encode("utf-8")
+
+    if args.bench:
+        sign = sk.sign
+        n = max(1, args.count)
+        t0 = time.perf_counter()
+        for _ in range(n):
+            sign(base)
+        dt = time.perf_counter() - t0
+        print(f"{n} signatures in {dt:.3f}s ({dt / n * 1e6:.1f} us/sig)")
+        return 0
     sig = sk.sign(base).signature
     sig_b64u = b64u(sig)
 
@@ -77,12 +103,25 @@ def main():
         "content-type":    "application/json",
     }
 
-    payload = {"namespace": args.namespace, "content": json.loads(args.json)}
-    r = requests.post(full, headers=headers, json=payload, timeout=10)
-    print("Status:", r.status_code)
+    body = orjson.dumps({"namespace": args.namespace, "content": orjson.loads(args.json)})
+
+    if args.count > 1:
+        # the signature covers METHOD + URL only, so one SigningKey and one
+        # signature serve every request in the loop
+        ok = 0
+        t0 = time.perf_counter()
+        for _ in range(args.count):
+            ok += _SESSION.post(full, headers=headers, data=body, timeout=10).ok
+        dt = time.perf_counter() - t0
+        print(f"Sent {args.count} POSTs: {ok} ok in {dt:.3f}s ({args.count / dt:.1f} req/s)")
+        return 0 if ok == args.count else 1
+
+    r = _SESSION.post(full, headers=headers, data=body, timeout=10)
+    print("Status:", r.status_code, flush=True)
     try:
-        print(json.dumps(r.json(), indent=2))
-    except Exception:
+        out = orjson.dumps(orjson.loads(r.content), option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        sys.stdout.buffer.write(out + b"\n")
+    except orjson.JSONDecodeError:
         print(r.text)
     return 0 if r.ok else 1
 
@@ -0,0 +1,52 @@
+# src/omp_ref_server/api/bodies.py
+"""
+Request bodies decoded straight from bytes.
+
+Routes that take `request: Request` and call decode_body() validate the raw
+body in one pydantic-core pass (no json.loads -> dict -> model round-trip).
+Errors keep FastAPI's RequestValidationError shape, so the 422 -> 400
+handler in api.errors still applies. json_body() supplies the OpenAPI
+requestBody those routes no longer declare as parameters.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+
+def decode_body(adapter: TypeAdapter, raw: bytes) -> Any:
+    try:
+        return adapter.validate_json(raw)
+    except ValidationError as e:
+        # minus the echoed input, which may be raw bytes
+        errors = [
+            {**err, "loc": ("body", *err["loc"])}
+            for err in e.errors(include_url=False, include_input=False)
+        ]
+        raise RequestValidationError(errors, body=raw)
+
+
+def _inline_refs(node: Any, defs: Dict[str, Any]) -> Any:
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            rest = {k: v for k, v in node.items() if k != "$ref"}
+            return {**_inline_refs(defs[ref[len("#/$defs/"):]], defs), **rest}
+        return {k: _inline_refs(v, defs) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(v, defs) for v in node]
+    return node
+
+
+def json_body(adapter: TypeAdapter) -> Dict[str, Any]:
+    """openapi_extra with the adapter's schema (nested models inlined)."""
+    schema = adapter.json_schema()
+    defs = schema.pop("$defs", {})
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_refs(schema, defs)}},
+        }
+    }
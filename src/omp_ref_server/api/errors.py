@@ -1,11 +1,26 @@
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from fastapi import Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import BaseModel, Field
 
 
+_STATUS_CODES: Dict[int, str] = {
+    400: "bad_request",
+    401: "unauthorized",
+    403: "forbidden",
+    404: "not_found",
+    409: "conflict",
+    422: "unprocessable_entity",
+    429: "rate_limited",
+    500: "internal_error",
+    503: "unavailable",
+}
+
+
 class OMPError(BaseModel):
     code: str = Field(..., description="Stable machine-readable code")
     message: str = Field(..., description="Human-readable explanation")
@@ -14,37 +29,38 @@ class OMPError(BaseModel):
 
     @staticmethod
     def code_for_status(status: int) -> str:
-        return {
-            400: "bad_request",
-            401: "unauthorized",
-            403: "forbidden",
-            404: "not_found",
-            409: "conflict",
-            422: "unprocessable_entity",
-            429: "rate_limited",
-            500: "internal_error",
-            503: "unavailable",
-        }.get(status, "error")
-
-
-def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+        return _STATUS_CODES.get(status, "error")
+
+
+def _error_payload(status: int, message: str, details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    # same shape as {"error": OMPError(...).model_dump()}, without the model
+    return {
+        "error": {
+            "code": OMPError.code_for_status(status),
+            "message": message,
+            "status": status,
+            "details": details,
+        }
+    }
+
+
+@lru_cache(maxsize=256)
+def _static_error_body(status: int, message: str) -> bytes:
+    # errors without details repeat a handful of (status, message) pairs
+    return orjson.dumps(_error_payload(status, message))
+
+
+def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    if isinstance(exc.detail, dict):
+        return ORJSONResponse(_error_payload(exc.status_code, "Error", exc.detail), status_code=exc.status_code)
     message = exc.detail if isinstance(exc.detail, str) else "Error"
-    details = exc.detail if isinstance(exc.detail, dict) else None
-    ompe = OMPError(
-        code=OMPError.code_for_status(exc.status_code),
-        message=message,
-        status=exc.status_code,
-        details=details,
+    return Response(
+        _static_error_body(exc.status_code, message),
+        status_code=exc.status_code,
+        media_type="application/json",
     )
-    return JSONResponse({"error": ompe.model_dump()}, status_code=exc.status_code)
 
 
-def request_validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+def request_validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     # Normalize FastAPI/Pydantic 422 into 400 with consistent shape
-    ompe = OMPError(
-        code="bad_request",
-        message="Invalid request",
-        status=400,
-        details={"errors": exc.errors()},
-    )
-    return JSONResponse({"error": ompe.model_dump()}, status_code=400)
+    return ORJSONResponse(_error_payload(400, "Invalid request", {"errors": exc.errors()}), status_code=400)
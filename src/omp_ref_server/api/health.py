@@ -1,7 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-router = APIRouter(tags=["system"])
+from omp_ref_server.api.static import StaticJSONRoute, static_json
+
+router = APIRouter(tags=["system"], route_class=StaticJSONRoute)
+
+_HEALTH_OK = b'{"status":"ok"}'
 
 @router.get("/health")
-def health():
-    return {"status": "ok"}
+@static_json(_HEALTH_OK)
+async def health() -> Response:
+    return Response(_HEALTH_OK, media_type="application/json")
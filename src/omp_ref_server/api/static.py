@@ -0,0 +1,43 @@
+# src/omp_ref_server/api/static.py
+"""
+Routes that always answer with the same JSON bytes (health, discovery).
+
+StaticJSONRoute documents the endpoint like any APIRoute, but requests are
+served by a bare ASGI callable that sends the precomputed body: no
+dependency solving, no Request/Response objects. Mark the endpoint with
+@static_json(body) and build its router with route_class=StaticJSONRoute.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+def static_json(body: bytes) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def mark(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        endpoint.static_json = body  # type: ignore[attr-defined]
+        return endpoint
+    return mark
+
+
+def static_json_app(body: bytes) -> ASGIApp:
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode("latin-1")),
+    ]
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+class StaticJSONRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, endpoint, **kwargs)
+        body = getattr(endpoint, "static_json", None)
+        if body is not None:
+            self.app = static_json_app(body)
@@ -1,30 +1,101 @@
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Dict, Mapping
 
-# Load .env file if present
+
+def _parse_env(path: Path) -> Dict[str, str]:
+    """Minimal .env reader: KEY=VALUE lines, optional `export `, # comments, quotes."""
+    env: Dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        k, v = line.split("=", 1)
+        k = k.strip().removeprefix("export ").strip()
+        v = v.strip()
+        if len(v) >= 2 and v[0] == v[-1] and v[0] in "\"'":
+            v = v[1:-1]
+        elif " #" in v:
+            v = v.split(" #", 1)[0].rstrip()
+        if k:
+            env[k] = v
+    return env
+
+
+def load_env_file(path: Path) -> None:
+    """Apply `path` to os.environ if it exists; real env vars win."""
+    if not path.is_file():
+        return
+    for k, v in _parse_env(path).items():
+        os.environ.setdefault(k, v)
+
+
+# The single .env load for the process (dev convenience). Production sets real
+# env vars and OMP_LOAD_DOTENV=0; OMP_ENV_FILE points at another file.
 BASE_DIR = Path(__file__).resolve().parent.parent
-load_dotenv(BASE_DIR / ".env")
+if os.getenv("OMP_LOAD_DOTENV", "1") == "1":
+    load_env_file(Path(os.getenv("OMP_ENV_FILE") or BASE_DIR / ".env"))
 
-# --- Core Server Config ---
-SERVER_HOST = os.getenv("OMP_SERVER_HOST", "0.0.0.0")
-SERVER_PORT = int(os.getenv("OMP_SERVER_PORT", 8080))
-DEBUG = os.getenv("OMP_DEBUG", "true").lower() == "true"
+# Read-only snapshot of the OMP_* environment, taken once at import. Settings
+# below (and per-request code) read this instead of os.environ.
+ENV: Mapping[str, str] = MappingProxyType({})
 
-# --- Auth & Security ---
-AUTH_MODE = os.getenv("OMP_AUTH_MODE", "ssh-key")  # ssh-key | token | none
-ALLOWED_KEYS_DIR = BASE_DIR / "keys"
 
-# --- Data Lifespan Defaults ---
-SHORT_LIFESPAN_TTL = int(os.getenv("OMP_SHORT_TTL", 300))  # seconds
-LONG_LIFESPAN_TTL = int(os.getenv("OMP_LONG_TTL", 31536000))  # 1 year
+def _load() -> None:
+    global ENV, SERVER_HOST, SERVER_PORT, DEBUG, AUTH_MODE, SIG_MODE, SIG_DEBUG
+    global SIG_CACHE_VERIFY, SIG_CACHE_VERIFY_TTL, SIG_BATCH_CACHE_SIZE
+    global SHORT_LIFESPAN_TTL, LONG_LIFESPAN_TTL, MAX_PAYLOAD_SIZE_MB, RATE_LIMIT_PER_MIN
+    global FAST_INGEST, DELETE_ON_READ_DEFAULT, GET_CACHE_SIZE, EXCHANGE_BATCH_MAX
+    global STORAGE_BACKEND, STORAGE_BACKEND_NAME
+
+    ENV = MappingProxyType({k: v for k, v in os.environ.items() if k.startswith("OMP_")})
+    env = ENV.get
+
+    # --- Core Server Config ---
+    SERVER_HOST = env("OMP_SERVER_HOST", "0.0.0.0")
+    SERVER_PORT = int(env("OMP_SERVER_PORT", 8080))
+    DEBUG = env("OMP_DEBUG", "true").lower() == "true"
+
+    # --- Auth & Security ---
+    AUTH_MODE = env("OMP_AUTH_MODE", "ssh-key")  # ssh-key | token | none
+    SIG_MODE = (env("OMP_SIG_MODE") or "off").strip().lower()  # off | permissive | strict
+    SIG_DEBUG = env("OMP_SIG_DEBUG") == "1"  # trace verification to stdout
+    # opt-in TTL cache of verified request signatures (widens the replay window)
+    SIG_CACHE_VERIFY = env("OMP_SIG_CACHE_VERIFY") == "1"
+    SIG_CACHE_VERIFY_TTL = float(env("OMP_SIG_CACHE_VERIFY_TTL", 5))  # seconds
+    SIG_BATCH_CACHE_SIZE = int(env("OMP_SIG_BATCH_CACHE_SIZE", 1024))  # verified batch roots; 0 disables
 
-# --- API Limits ---
-MAX_PAYLOAD_SIZE_MB = int(os.getenv("OMP_MAX_PAYLOAD_MB", 5))
-RATE_LIMIT_PER_MIN = int(os.getenv("OMP_RATE_LIMIT", 60))
+    # --- Data Lifespan Defaults ---
+    SHORT_LIFESPAN_TTL = int(env("OMP_SHORT_TTL", 300))  # seconds
+    LONG_LIFESPAN_TTL = int(env("OMP_LONG_TTL", 31536000))  # 1 year
 
-# --- Storage ---
-STORAGE_BACKEND = os.getenv("OMP_STORAGE_BACKEND", "local")  # local | redis | s3
+    # --- API Limits ---
+    MAX_PAYLOAD_SIZE_MB = int(env("OMP_MAX_PAYLOAD_MB", 5))
+    RATE_LIMIT_PER_MIN = int(env("OMP_RATE_LIMIT", 60))
+    EXCHANGE_BATCH_MAX = int(env("OMP_EXCHANGE_BATCH_MAX", 1000))  # envelopes per /exchange/batch
+
+    # --- Fast paths ---
+    # POST /objects: skip Pydantic, decode with orjson + minimal type checks
+    FAST_INGEST = env("OMP_FAST_INGEST", "false").lower() == "true"
+    # GET /objects/{id}: delete every object after it is read
+    DELETE_ON_READ_DEFAULT = env("OMP_DELETE_ON_READ_DEFAULT", "0") == "1"
+    # GET /objects/{id}: encoded responses cached per storage adapter; 0 disables
+    GET_CACHE_SIZE = int(env("OMP_GET_CACHE_SIZE", 4096))
+
+    # --- Storage ---
+    STORAGE_BACKEND = env("OMP_STORAGE_BACKEND", "local")  # local | redis | s3
+    STORAGE_BACKEND_NAME = env("OMP_STORAGE", "memory").lower()  # adapter for get_storage()
+
+
+def refresh_env_cache() -> None:
+    """Re-snapshot OMP_* vars after os.environ changes (tests, reloads)."""
+    _load()
+
+
+_load()
+
+ALLOWED_KEYS_DIR = BASE_DIR / "keys"
 DATA_DIR = BASE_DIR / "data"
 
 # Ensure dirs exist
@@ -1,14 +1,54 @@
 # src/omp_ref_server/infra/memory_storage.py
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, List
-from uuid import uuid4
+import base64
+import os
+from collections import deque
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from uuid import UUID
 from datetime import datetime, timezone
 
-# We reuse the API contracts as DTOs for now (keeps tests stable).
-# Later we can move these DTOs into a shared models module.
-from api.objects import ObjectOut, ObjectDataOut, ObjectListOut
+from sortedcontainers import SortedList
+
+from omp_ref_server.config import settings
+from omp_ref_server.models.objects import ObjectOut, ObjectDataOut, ObjectListOut
 from omp_ref_server.ports.storage import StoragePort
+from omp_ref_server.utils.response_cache import ResponseCache
+from omp_ref_server.utils.trigrams import MIN_NEEDLE, TrigramIndex
+
+# Object ids: random v4 UUIDs, minted in batches so one os.urandom call serves
+# _ID_BATCH writes. deque.popleft is atomic, so no lock is needed.
+_ID_BATCH = 1024
+_id_pool: "deque[str]" = deque()
+
+
+def _new_id() -> str:
+    try:
+        return _id_pool.popleft()
+    except IndexError:
+        raw = os.urandom(16 * _ID_BATCH)
+        _id_pool.extend(str(UUID(bytes=raw[i:i + 16], version=4)) for i in range(16, len(raw), 16))
+        return str(UUID(bytes=raw[:16], version=4))
+
+
+def _encode_cursor(pos: Tuple[datetime, str]) -> str:
+    raw = f"{pos[0].isoformat()}|{pos[1]}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Opaque cursor -> (created_at, id) position; ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        ts, oid = raw.split("|", 1)
+        created_at = datetime.fromisoformat(ts)
+    except ValueError:
+        raise ValueError("invalid cursor") from None
+    if created_at.tzinfo is None:
+        raise ValueError("invalid cursor")
+    return (created_at, oid)
 
 
 class MemoryStorage(StoragePort):
@@ -18,7 +58,54 @@ class MemoryStorage(StoragePort):
     """
 
     def __init__(self) -> None:
-        self._db: Dict[str, Dict[str, Any]] = {}
+        # id -> (meta, content). `meta` is the ObjectOut itself: list/search
+        # hand it out by reference, so reads allocate nothing per item.
+        self._db: Dict[str, Tuple[ObjectOut, Dict[str, Any]]] = {}
+        # Ordered indexes of (created_at, id), maintained on store/delete so
+        # list/search never sort. Cursors encode the position of the last item
+        # returned, so they stay valid even if that object is deleted.
+        self._order: SortedList = SortedList()
+        self._by_ns: Dict[str, SortedList] = {}
+        # key substring index (key_contains with len >= MIN_NEEDLE)
+        self._keys = TrigramIndex()
+        # encoded GET responses; entries are dropped on update/delete below
+        self.response_cache = ResponseCache(settings.GET_CACHE_SIZE)
+
+    # --- Index helpers ---
+    # meta -> (created_at, id) index position; attrgetter runs in C
+    _pos = staticmethod(attrgetter("created_at", "id"))
+
+    def _window(self, index: SortedList, cursor: Optional[str]) -> Iterable[str]:
+        """Ids from `index` strictly after `cursor`, in (created_at, id) order."""
+        start = index.bisect_right(_decode_cursor(cursor)) if cursor else 0
+        return (oid for _, oid in islice(index, start, None))
+
+    def _page(self, rows: Iterable[ObjectOut], limit: int) -> ObjectListOut:
+        """First `limit` rows, plus a next-page cursor if more remain."""
+        limit = max(0, limit)
+        items = list(islice(rows, limit + 1))
+        cursor = _encode_cursor(self._pos(items[limit - 1])) if len(items) > limit > 0 else None
+        del items[limit:]
+        return ObjectListOut(len(items), items, cursor)
+
+    def _metas(self, ids: Iterable[str]) -> Iterable[ObjectOut]:
+        db = self._db
+        return (db[oid][0] for oid in ids)
+
+    def _key_matches(
+        self, needle: str, namespace: Optional[str], cursor: Optional[str]
+    ) -> List[ObjectOut]:
+        """Rows whose key contains `needle` (len >= MIN_NEEDLE), via the trigram index."""
+        after = _decode_cursor(cursor) if cursor else None
+        # trigram hits are candidates only: confirm the substring and filters
+        rows = [
+            m for m in self._metas(self._keys.candidates(needle))
+            if needle in m.key
+            and (namespace is None or m.namespace == namespace)
+            and (after is None or self._pos(m) > after)
+        ]
+        rows.sort(key=self._pos)
+        return rows
 
     # --- Port methods ---
     def store(
@@ -28,58 +115,37 @@ class MemoryStorage(StoragePort):
         content: Dict[str, Any],
         metadata: Dict[str, Any],
     ) -> ObjectOut:
-        oid = str(uuid4())
+        oid = _new_id()
         k = key or oid
-        rec = {
-            "id": oid,
-            "namespace": namespace,
-            "key": k,
-            "created_at": datetime.now(timezone.utc),
-            "metadata": metadata or {},
-            "content": content,
-        }
-        self._db[oid] = rec
-        return ObjectOut(
-            id=oid,
-            namespace=namespace,
-            key=k,
-            created_at=rec["created_at"],
-            metadata=rec["metadata"],
-        )
+        meta = ObjectOut(oid, namespace, k, datetime.now(timezone.utc), metadata or {})
+        self._db[oid] = (meta, content)
+        pos = self._pos(meta)
+        self._order.add(pos)
+        self._by_ns.setdefault(namespace, SortedList()).add(pos)
+        self._keys.add(oid, k)
+        return meta
 
     def get(self, object_id: str) -> ObjectDataOut:
         if object_id not in self._db:
             raise KeyError(object_id)
-        r = self._db[object_id]
-        return ObjectDataOut(
-            id=r["id"],
-            namespace=r["namespace"],
-            key=r["key"],
-            created_at=r["created_at"],
-            metadata=r["metadata"],
-            content=r["content"],
-        )
+        m, content = self._db[object_id]
+        return ObjectDataOut(m.id, m.namespace, m.key, m.created_at, m.metadata, content)
 
     def delete(self, object_id: str) -> None:
         if object_id not in self._db:
             raise KeyError(object_id)
-        del self._db[object_id]
+        meta, _ = self._db.pop(object_id)
+        self.response_cache.discard(object_id)
+        pos = self._pos(meta)
+        self._order.remove(pos)
+        bucket = self._by_ns[meta.namespace]
+        bucket.remove(pos)
+        if not bucket:
+            del self._by_ns[meta.namespace]
+        self._keys.discard(object_id, meta.key)
 
     def list(self, limit: int = 50, cursor: Optional[str] = None) -> ObjectListOut:
-        rows: List[Dict[str, Any]] = list(self._db.values())
-        rows.sort(key=lambda r: (r["created_at"], r["id"]))
-        rows = rows[: max(0, limit)]
-        items = [
-            ObjectOut(
-                id=r["id"],
-                namespace=r["namespace"],
-                key=r["key"],
-                created_at=r["created_at"],
-                metadata=r["metadata"],
-            )
-            for r in rows
-        ]
-        return ObjectListOut(count=len(items), items=items)
+        return self._page(self._metas(self._window(self._order, cursor)), limit)
 
     def search(
         self,
@@ -88,24 +154,20 @@ class MemoryStorage(StoragePort):
         limit: int = 50,
         cursor: Optional[str] = None,
     ) -> ObjectListOut:
-        rows: List[Dict[str, Any]] = list(self._db.values())
-        if namespace is not None:
-            rows = [r for r in rows if r["namespace"] == namespace]
-        if key_contains:
-            rows = [r for r in rows if key_contains in (r.get("key") or "")]
-        rows.sort(key=lambda r: (r["created_at"], r["id"]))
-        rows = rows[: max(0, limit)]
-        items = [
-            ObjectOut(
-                id=r["id"],
-                namespace=r["namespace"],
-                key=r["key"],
-                created_at=r["created_at"],
-                metadata=r["metadata"],
-            )
-            for r in rows
-        ]
-        return ObjectListOut(count=len(items), items=items)
+        rows: Iterable[ObjectOut]
+        if key_contains and len(key_contains) >= MIN_NEEDLE:
+            rows = self._key_matches(key_contains, namespace, cursor)
+        else:
+            if namespace is not None:
+                index = self._by_ns.get(namespace)
+                if index is None:
+                    return ObjectListOut(0, [])
+            else:
+                index = self._order
+            rows = self._metas(self._window(index, cursor))
+            if key_contains:
+                rows = (m for m in rows if key_contains in m.key)
+        return self._page(rows, limit)
 
     def update(
         self,
@@ -117,14 +179,9 @@ class MemoryStorage(StoragePort):
             raise KeyError(object_id)
         if not isinstance(content, dict):
             raise ValueError("content must be an object")
-        r = self._db[object_id]
-        r["content"] = content
+        meta, _ = self._db[object_id]
+        self._db[object_id] = (meta, content)
+        self.response_cache.discard(object_id)
         if metadata is not None:
-            r["metadata"] = metadata
-        return ObjectOut(
-            id=r["id"],
-            namespace=r["namespace"],
-            key=r["key"],
-            created_at=r["created_at"],
-            metadata=r["metadata"],
-        )
+            meta.metadata = metadata
+        return meta
@@ -1,27 +1,30 @@
 # src/omp_ref_server/infra/providers.py
 from __future__ import annotations
 
-import os
-from typing import Optional
+from functools import lru_cache
+
+from omp_ref_server.config import settings
 from omp_ref_server.ports.storage import StoragePort
 from .memory_storage import MemoryStorage
 
-# singletons per-process
-_memory: Optional[MemoryStorage] = None
+# OMP_STORAGE values that select the in-memory adapter
+_MEMORY_ALIASES = frozenset({"", "memory", "mem", "inmemory", "in-memory"})
 
 
+@lru_cache(maxsize=1)
 def get_storage() -> StoragePort:
     """
     Adapter selector. Default: in-memory for dev.
     Set OMP_STORAGE=<backend> to switch when real adapters are available.
+
+    Resolved once per process (it is a per-request FastAPI dependency);
+    after changing OMP_STORAGE, call settings.refresh_env_cache() and
+    get_storage.cache_clear() to re-select.
     """
-    global _memory
-    backend = os.getenv("OMP_STORAGE", "memory").lower()
+    backend = settings.STORAGE_BACKEND_NAME
 
-    if backend in ("", "memory", "mem", "inmemory", "in-memory"):
-        if _memory is None:
-            _memory = MemoryStorage()
-        return _memory
+    if backend in _MEMORY_ALIASES:
+        return MemoryStorage()
 
     # Future:
     # if backend == "postgres":
@@ -32,6 +35,4 @@ def get_storage() -> StoragePort:
     #     return RedisStorage.from_env()
 
     # Unknown backend → safe dev default
-    if _memory is None:
-        _memory = MemoryStorage()
-    return _memory
+    return MemoryStorage()
@@ -1,31 +1,33 @@
 # src/main.py
-import os
-import json
-from typing import Optional, List
+import orjson
+from dataclasses import dataclass
+from typing import Dict, Optional, List, Set
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field, ConfigDict
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime, UTC
 
+from omp_ref_server.config import settings  # performs the one .env load
 from omp_ref_server.api.health import router as health_router
 from omp_ref_server.api.discovery import router as discovery_router
-from omp_ref_server.models import OMPEnvelope
+from omp_ref_server.models import ENVELOPE_ADAPTER, OMPEnvelope
+from omp_ref_server.utils.trigrams import MIN_NEEDLE, TrigramIndex
 from api.objects import router as objects_router
 
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.middleware.gzip import GZipMiddleware
 from omp_ref_server.api.errors import http_exception_handler, request_validation_exception_handler
+from omp_ref_server.api.bodies import decode_body, json_body
 
 from api.exchange import router as exchange_router
 
-# Load env vars
-from dotenv import load_dotenv
-load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
-
 app = FastAPI(
     title="Open Memory Protocol — Reference Server",
     description="Structured data exchange between agents — all data, short or long lifespan.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(health_router)
@@ -34,91 +36,198 @@ app.include_router(objects_router)
 app.include_router(exchange_router)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
+# App-wide: list/search pages are repetitive JSON, and large object bodies
+# compress too (GET /objects/{id} therefore sends weak ETags). Small bodies
+# aren't worth compressing.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # In-memory storage for now (replace with backends later)
-data_store = {}
+def _encoded_size(value) -> Optional[int]:
+    try:
+        return len(orjson.dumps(value))
+    except TypeError:
+        return None
+
+
+@dataclass(slots=True)
+class Record:
+    value: dict
+    lifespan: str
+    size_bytes: Optional[int]  # encoded size, computed at write time
+    seq: int                   # first-insertion position, for result order
+
+
+class LegacyStore:
+    """
+    Key/value store behind the legacy routes: one slotted Record per key, plus
+    lifespan and key-substring indexes so /search only touches matching keys.
+    Listing and search results keep first-insertion order.
+    """
+
+    def __init__(self) -> None:
+        self.records: Dict[str, Record] = {}
+        self.by_lifespan: Dict[str, Set[str]] = {}
+        self.keys = TrigramIndex()
+        self._next_seq = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.records
+
+    def get(self, key: str) -> Optional[dict]:
+        r = self.records.get(key)
+        if r is None:
+            return None
+        return {"value": r.value, "lifespan": r.lifespan}
+
+    def put(self, key: str, value: dict, lifespan: str) -> None:
+        r = self.records.get(key)
+        if r is None:
+            self.keys.add(key, key)
+            self.records[key] = Record(value, lifespan, _encoded_size(value), self._next_seq)
+            self._next_seq += 1
+        else:
+            if r.lifespan != lifespan:
+                self.by_lifespan[r.lifespan].discard(key)
+            r.value, r.lifespan, r.size_bytes = value, lifespan, _encoded_size(value)
+        self.by_lifespan.setdefault(lifespan, set()).add(key)
+
+    def delete(self, key: str) -> bool:
+        r = self.records.pop(key, None)
+        if r is None:
+            return False
+        self.by_lifespan[r.lifespan].discard(key)
+        self.keys.discard(key, key)
+        return True
+
+    def listing(self) -> List[dict]:
+        return [
+            {"key": k, "lifespan": r.lifespan, "size_bytes": r.size_bytes}
+            for k, r in self.records.items()
+        ]
+
+    def search(self, contains: Optional[str] = None, lifespan: Optional[str] = None) -> List[dict]:
+        records = self.records
+        if contains and len(contains) >= MIN_NEEDLE:
+            hits = {k for k in self.keys.candidates(contains) if contains in k}
+            if lifespan:
+                hits &= self.by_lifespan.get(lifespan, set())
+        elif lifespan:
+            hits = self.by_lifespan.get(lifespan, set())
+            if contains:
+                hits = {k for k in hits if contains in k}
+        else:
+            return [
+                {"key": k, "lifespan": r.lifespan}
+                for k, r in records.items()
+                if not contains or contains in k
+            ]
+        keys = sorted(hits, key=lambda k: records[k].seq)
+        return [{"key": k, "lifespan": records[k].lifespan} for k in keys]
+
+
+data_store = LegacyStore()
 
 # -------- Legacy demo models/routes (kept until 8.0b.7 removes them) --------
+_LIFESPANS = frozenset({"short", "long"})
+_ALLOWED_PERF = frozenset({"inform", "request", "propose", "agree", "refuse", "query"})
+
 class DataItem(BaseModel):
     key: str
     value: dict
     lifespan: str  # "short" or "long"
 
-# ----- OMP 0.1 Envelope -----
-class OMPProof(BaseModel):
-    type: str = "JWS"
-    alg: str = "Ed25519"
-    jws: Optional[str] = None   # set in 7.1
-
-class OMPTrace(BaseModel):
-    ttl_ms: Optional[int] = 30000
-    retry: Optional[int] = 0
-    causality: Optional[List[str]] = []
-
 # Root endpoint
 @app.get("/")
-def root():
+async def root():
     return {"status": "OMP reference server running"}
 
+_DATA_ITEM = TypeAdapter(DataItem)
+
 # Store data
-@app.post("/store")
-def store_data(item: DataItem):
-    if item.lifespan not in ["short", "long"]:
+@app.post("/store", openapi_extra=json_body(_DATA_ITEM))
+async def store_data(request: Request):
+    item: DataItem = decode_body(_DATA_ITEM, await request.body())
+    if item.lifespan not in _LIFESPANS:
         raise HTTPException(status_code=400, detail="Invalid lifespan")
-    data_store[item.key] = {"value": item.value, "lifespan": item.lifespan}
+    data_store.put(item.key, item.value, item.lifespan)
     return {"message": "stored", "key": item.key}
 
 # Retrieve data
 @app.get("/get/{key}")
-def get_data(key: str):
-    if key not in data_store:
+async def get_data(key: str):
+    data = data_store.get(key)
+    if data is None:
         raise HTTPException(status_code=404, detail="Key not found")
-    return data_store[key]
+    return data
 
 # Delete data
 @app.delete("/delete/{key}")
-def delete_data(key: str):
-    if key in data_store:
-        del data_store[key]
+async def delete_data(key: str):
+    if data_store.delete(key):
         return {"message": "deleted"}
     raise HTTPException(status_code=404, detail="Key not found")
 
 # List everything in the in-memory store
 @app.get("/list")
-def list_items():
-    out = []
-    for k, v in data_store.items():
-        try:
-            size_bytes = len(json.dumps(v["value"]))
-        except Exception:
-            size_bytes = None
-        out.append({
-            "key": k,
-            "lifespan": v.get("lifespan"),
-            "size_bytes": size_bytes
-        })
+async def list_items():
+    out = data_store.listing()
     return {"count": len(out), "items": out}
 
 # Search by key substring and/or lifespan
 @app.get("/search")
-def search_items(contains: Optional[str] = None, lifespan: Optional[str] = None):
-    results = []
-    for k, v in data_store.items():
-        if contains and contains not in k:
-            continue
-        if lifespan and v.get("lifespan") != lifespan:
-            continue
-        results.append({"key": k, "lifespan": v.get("lifespan")})
+async def search_items(contains: Optional[str] = None, lifespan: Optional[str] = None):
+    results = data_store.search(contains, lifespan)
+    return {"count": len(results), "results": results}
+
+# ----- Legacy /exchange capability handlers: (payload, store) -> result section -----
+def _handle_write(payload: dict, store: LegacyStore) -> dict:
+    key = payload.get("key")
+    value = payload.get("value")
+    lifespan = payload.get("lifespan", "short")
+    if not key or value is None:
+        raise ValueError("payload must include key and value")
+    if lifespan not in _LIFESPANS:
+        raise ValueError("invalid lifespan in payload")
+    store.put(key, value, lifespan)
+    return {"stored": True, "key": key}
+
+def _handle_read(payload: dict, store: LegacyStore) -> dict:
+    key = payload.get("key")
+    if not key:
+        raise ValueError("payload must include key")
+    data = store.get(key)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Key not found")
+    return {"key": key, "data": data}
+
+def _handle_delete(payload: dict, store: LegacyStore) -> dict:
+    key = payload.get("key")
+    if not key:
+        raise ValueError("payload must include key")
+    if not store.delete(key):
+        raise HTTPException(status_code=404, detail="Key not found")
+    return {"deleted": True, "key": key}
+
+def _handle_search(payload: dict, store: LegacyStore) -> dict:
+    results = store.search(payload.get("contains"), payload.get("lifespan"))
     return {"count": len(results), "results": results}
 
-@app.post("/exchange")
-def exchange_message(env: OMPEnvelope):
+# capability -> (result field, handler)
+_HANDLERS = {
+    "data.write": ("write", _handle_write),
+    "data.read": ("read", _handle_read),
+    "data.delete": ("delete", _handle_delete),
+    "data.search": ("search", _handle_search),
+}
+
+@app.post("/exchange", openapi_extra=json_body(ENVELOPE_ADAPTER))
+async def exchange_message(request: Request):
+    env: OMPEnvelope = decode_body(ENVELOPE_ADAPTER, await request.body())
     # TODO (7.1): verify env.proof.jws (Ed25519); DID/VC
-    allowed_perf = {"inform", "request", "propose", "agree", "refuse", "query"}
-    if env.performative not in allowed_perf:
+    if env.performative not in _ALLOWED_PERF:
         raise HTTPException(status_code=400, detail="invalid performative")
-    allowed_caps = {"data.read", "data.write", "data.search", "data.delete"}
-    if env.capability not in allowed_caps:
+    handler = _HANDLERS.get(env.capability)
+    if handler is None:
         raise HTTPException(status_code=400, detail="invalid capability")
 
     # Simple demo behavior:
@@ -129,59 +238,20 @@ def exchange_message(env: OMPEnvelope):
         "capability": env.capability,
     }
 
+    field, handle = handler
     try:
-        if env.capability == "data.write":
-            key = env.payload.get("key")
-            value = env.payload.get("value")
-            lifespan = env.payload.get("lifespan", "short")
-            if not key or value is None:
-                raise ValueError("payload must include key and value")
-            if lifespan not in ["short", "long"]:
-                raise ValueError("invalid lifespan in payload")
-            data_store[key] = {"value": value, "lifespan": lifespan}
-            result["write"] = {"stored": True, "key": key}
-
-        elif env.capability == "data.read":
-            key = env.payload.get("key")
-            if not key:
-                raise ValueError("payload must include key")
-            if key not in data_store:
-                raise HTTPException(status_code=404, detail="Key not found")
-            result["read"] = {"key": key, "data": data_store[key]}
-
-        elif env.capability == "data.delete":
-            key = env.payload.get("key")
-            if not key:
-                raise ValueError("payload must include key")
-            if key in data_store:
-                del data_store[key]
-                result["delete"] = {"deleted": True, "key": key}
-            else:
-                raise HTTPException(status_code=404, detail="Key not found")
-
-        elif env.capability == "data.search":
-            contains = env.payload.get("contains")
-            lifespan = env.payload.get("lifespan")
-            results = []
-            for k, v in data_store.items():
-                if contains and contains not in k:
-                    continue
-                if lifespan and v.get("lifespan") != lifespan:
-                    continue
-                results.append({"key": k, "lifespan": v.get("lifespan")})
-            result["search"] = {"count": len(results), "results": results}
+        result[field] = handle(env.payload, data_store)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    result["received_at"] = datetime.now(UTC).isoformat()
+    result["received_at"] = datetime.now(UTC)
     return result
 
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "omp_ref_server.main:app",
-        host=os.getenv("OMP_SERVER_HOST", "0.0.0.0"),
-        port=int(os.getenv("OMP_SERVER_PORT", "8080")),
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
         reload=True,
     )
@@ -1,16 +1,30 @@
 from .envelope_v01 import (
     OMPEnvelopeV01 as OMPEnvelope,
     OMPEnvelopeV01,
+    ENVELOPE_ADAPTER,
     OMP_VERSION,
     OMP_SPEC_URL,
     PartyRef,
     SignatureRef,
 )
+from .objects import (
+    ObjectIn,
+    ObjectOut,
+    ObjectDataOut,
+    ObjectListOut,
+    ObjectUpdateIn,
+)
 __all__ = [
     "OMPEnvelope",
     "OMPEnvelopeV01",
+    "ENVELOPE_ADAPTER",
     "OMP_VERSION",
     "OMP_SPEC_URL",
     "PartyRef",
     "SignatureRef",
+    "ObjectIn",
+    "ObjectOut",
+    "ObjectDataOut",
+    "ObjectListOut",
+    "ObjectUpdateIn",
 ]
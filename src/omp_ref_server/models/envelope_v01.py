@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Any, Dict, Optional, List
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, UTC
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 # ---- protocol constants (draft) ----
 OMP_VERSION: str = "0.1.0"
@@ -18,11 +18,14 @@ class SignatureRef(BaseModel):
     key_id: Optional[str] = None
 
 class OMPEnvelopeV01(BaseModel):
+    # keep wire field names as-is
+    model_config = ConfigDict(populate_by_name=True, str_strip_whitespace=True)
+
     # header
     omp_version: str = Field(default=OMP_VERSION)
     spec: str = Field(default=OMP_SPEC_URL)
     envelope_id: Optional[str] = None                   # urn:uuid:...
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     ttl_seconds: Optional[int] = None
 
     # addressing & intent
@@ -38,7 +41,6 @@ class OMPEnvelopeV01(BaseModel):
     # payload
     content: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        # keep wire field names as-is
-        populate_by_name = True
-        str_strip_whitespace = True
+
+# Built once; validate request bodies with ENVELOPE_ADAPTER.validate_json(raw)
+ENVELOPE_ADAPTER: TypeAdapter[OMPEnvelopeV01] = TypeAdapter(OMPEnvelopeV01)
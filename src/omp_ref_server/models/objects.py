@@ -0,0 +1,51 @@
+# src/omp_ref_server/models/objects.py
+"""
+Objects API contracts. Shared by the router (api.objects), the storage port
+and its adapters, so adapters never import the API layer.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+# --- Requests (validated on ingress) ---
+
+class ObjectIn(BaseModel):
+    namespace: str = Field(..., description="Logical bucket / tenant / space")
+    key: Optional[str] = Field(None, description="Caller-supplied key; generate if absent")
+    content: Dict[str, Any] = Field(..., description="Arbitrary structured payload")
+    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+
+# --- Responses ---
+# Plain slotted dataclasses: built by storage adapters, never re-validated,
+# and serialized natively by orjson. FastAPI still derives the OpenAPI schema.
+
+@dataclass(slots=True)
+class ObjectOut:
+    id: str
+    namespace: str
+    key: str
+    created_at: datetime
+    metadata: Dict[str, Any]
+
+@dataclass(slots=True)
+class ObjectDataOut:
+    id: str
+    namespace: str
+    key: str
+    created_at: datetime
+    metadata: Dict[str, Any]
+    content: Dict[str, Any]
+
+@dataclass(slots=True)
+class ObjectListOut:
+    count: int
+    items: List[ObjectOut]
+    cursor: Optional[str] = None  # opaque cursor for the next page; None when exhausted
+
+
+class ObjectUpdateIn(BaseModel):
+    content: Any = Field(..., description="New full content to replace the current one")
+    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
@@ -3,9 +3,8 @@
 StoragePort — the hexagonal 'port' interface for object storage backends.
 
 NOTE:
-- We reference response models from `api.objects` only for type hints, and
-  only during type-checking (TYPE_CHECKING). At runtime there is **no import**
-  from api → avoids circular deps.
+- Response models live in `omp_ref_server.models.objects`; they are imported
+  only during type-checking (TYPE_CHECKING), so the port has no runtime deps.
 """
 
 from __future__ import annotations
@@ -14,7 +13,7 @@ from typing import Protocol, Optional, Dict, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Only for typing; safe at runtime.
-    from api.objects import ObjectOut, ObjectDataOut, ObjectListOut
+    from omp_ref_server.models.objects import ObjectOut, ObjectDataOut, ObjectListOut
 
 
 class StoragePort(Protocol):
@@ -28,6 +27,16 @@ class StoragePort(Protocol):
       - list       -> paged listing (cursor is adapter-defined/opaque)
       - search     -> filters by namespace and/or key_contains
       - update     -> full replacement of 'content' (+ optional metadata)
+
+    Optional: an adapter may expose `response_cache` (a
+    utils.response_cache.ResponseCache) for GET /objects/{id}; it must then
+    discard an id on every update/delete of that object.
+
+    The methods are synchronous, and the /objects handlers (`async def`) call
+    them directly on the event loop, so implementations must not block. The
+    in-memory adapter is pure dict work. A blocking (network- or disk-backed)
+    adapter cannot be plugged in as is: it needs either async port methods
+    awaited by the handlers, or handlers that call it via run_in_threadpool.
     """
 
     def store(
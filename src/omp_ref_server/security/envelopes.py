@@ -0,0 +1,101 @@
+# src/omp_ref_server/security/envelopes.py
+"""
+Envelope integrity checks for /exchange (OMP 0.1 draft).
+
+  - hash_ok: envelope.content_hash == "sha256:<hex>" of the canonical content
+  - sig_ok:  envelope.signature.sig (base64, Ed25519, detached) verifies over
+             the canonical envelope without its `signature` field, using the
+             key pinned for signature.key_id (False if that key_id is not
+             pinned); without a key_id, the sender's embedded "ed25519:<b64>"
+             public key (integrity only, not identity)
+
+Canonical form: JSON with sorted keys and no whitespace (orjson OPT_SORT_KEYS),
+datetimes as emitted by the envelope model's JSON mode.
+"""
+from __future__ import annotations
+
+import hashlib
+import hmac
+from typing import Dict, List, Optional
+
+import orjson
+from nacl.exceptions import BadSignatureError, ValueError as NaClValueError, TypeError as NaClTypeError
+
+from omp_ref_server.models import OMPEnvelope
+from omp_ref_server.security.signatures import (
+    as_verify_key_bytes,
+    b64std_decode,
+    b64url_decode,
+    get_verify_key,
+    get_ed25519_pub_by_keyid,
+)
+
+
+def canonical_content_hash(envelope: OMPEnvelope) -> str:
+    return "sha256:" + hashlib.sha256(orjson.dumps(envelope.content, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def canonical_envelope_bytes(envelope: OMPEnvelope) -> bytes:
+    return orjson.dumps(envelope.model_dump(mode="json", exclude={"signature"}), option=orjson.OPT_SORT_KEYS)
+
+
+def _envelope_pub(envelope: OMPEnvelope) -> Optional[bytes]:
+    sig = envelope.signature
+    if sig is not None and sig.key_id:
+        # a declared key_id must resolve to a pinned key; falling back to the
+        # embedded key would let any sender sign as that identity
+        pub = get_ed25519_pub_by_keyid(sig.key_id)
+        return bytes(pub) if pub else None
+    ref = envelope.sender.public_key if envelope.sender else None
+    if ref:
+        try:
+            return as_verify_key_bytes(ref.removeprefix("ed25519:"))
+        except ValueError:
+            return None
+    return None
+
+
+def _decode_sig(value: str) -> Optional[bytes]:
+    for decoder in (b64std_decode, b64url_decode):
+        try:
+            raw = decoder(value)
+        except ValueError:
+            continue
+        if len(raw) == 64:
+            return raw
+    return None
+
+
+def verify_envelopes(envelopes: List[OMPEnvelope]) -> List[Dict[str, bool]]:
+    """
+    Per-envelope {"sig_ok", "hash_ok"}, in input order. CPU-bound: async
+    callers should run it in a worker thread. VerifyKeys come from the
+    process-wide per-key cache in security.signatures.
+    """
+    out: List[Dict[str, bool]] = []
+    for env in envelopes:
+        # compared as bytes: compare_digest rejects non-ASCII str
+        hash_ok = bool(env.content_hash) and hmac.compare_digest(
+            env.content_hash.lower().encode("utf-8"), canonical_content_hash(env).encode("ascii")
+        )
+
+        sig_ok = False
+        sig = env.signature
+        if sig is not None and sig.alg.lower() == "ed25519":
+            pub = _envelope_pub(env)
+            raw = _decode_sig(sig.sig)
+            if pub is not None and raw is not None:
+                vk = get_verify_key(pub)
+                if vk is not None:
+                    try:
+                        vk.verify(canonical_envelope_bytes(env), raw)
+                        sig_ok = True
+                    except (BadSignatureError, NaClValueError, NaClTypeError):
+                        pass
+
+        out.append({"sig_ok": sig_ok, "hash_ok": hash_ok})
+    return out
+
+
+def verify_envelope(envelope: OMPEnvelope) -> Dict[str, bool]:
+    return verify_envelopes([envelope])[0]
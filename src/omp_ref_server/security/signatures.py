@@ -2,135 +2,206 @@
 from __future__ import annotations
 
 import os
+import re
 import base64
 import binascii
-from typing import Dict, Optional, Set, Iterable, List, Any
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, Set, List, Any, Tuple
 
 from fastapi import Request, HTTPException, status
 from nacl.signing import VerifyKey
 from nacl.exceptions import BadSignatureError, ValueError as NaClValueError, TypeError as NaClTypeError
 
+from omp_ref_server.config import settings
 
-if os.getenv("OMP_SIG_DEBUG") == "1":
+# Optional: pybase64 (SIMD libbase64) decodes with the same API and errors
+try:
+    import pybase64 as _b64
+except ImportError:  # pragma: no cover - stdlib fallback
+    _b64 = base64
+
+# OMP_SIG_DEBUG=1 (settings.SIG_DEBUG): trace verification to stdout.
+def set_debug(on: bool) -> None:
+    settings.SIG_DEBUG = bool(on)
+
+
+if settings.SIG_DEBUG:
     print("signatures.py loaded as", __name__)
 
 # -----------------------------------------------------------------------------
 # Canonical base helpers
 # -----------------------------------------------------------------------------
 
+# The base caches below are keyed on client-controlled strings (path, query,
+# Host) and are filled before any key or signature check, so oversized input
+# bypasses them, as with the header parse caches.
+_BASES_CACHE_MAX_LEN = 1024
+
+
 def build_signing_base(request: Request) -> bytes:
     """
     Canonical base the tests expect in several places:
         "<METHOD> http://testserver{path}"
     """
-    method = request.method.upper()
-    base_url = str(request.base_url).rstrip("/")   # e.g. "http://testserver"
-    path = request.url.path                        # e.g. "/objects"
-    return f"{method} {base_url}{path}".encode("utf-8")
+    base_url = str(request.base_url)                # e.g. "http://testserver/"
+    path = request.url.path                         # e.g. "/objects"
+    if len(base_url) + len(path) > _BASES_CACHE_MAX_LEN:
+        return _build_signing_base(request.method, base_url, path)
+    return _build_signing_base_cached(request.method, base_url, path)
 
 
-def _candidate_bases(request: Request) -> Iterable[bytes]:
-    """
-    Deterministic set of bases to tolerate tiny differences between how the
-    client builds its URL and how Starlette renders it.
-    """
-    method = request.method.upper()
+def _build_signing_base(method: str, base_url: str, path: str) -> bytes:
+    return f"{method.upper()} {base_url.rstrip('/')}{path}".encode("utf-8")
 
-    root_path = request.scope.get("root_path") or ""
-    path_only = request.url.path
-    full_path = f"{root_path}{path_only}"
 
-    # server-tuple based (mirrors TestClient precisely)
-    scheme = request.url.scheme or "http"
-    server_based: Optional[str] = None
-    server = request.scope.get("server")  # ("testserver", 80)
-    if isinstance(server, tuple) and len(server) == 2 and server[0]:
-        host_s, port_s = server[0], server[1]
-        is_default = (scheme == "http" and (port_s in (80, None))) or (scheme == "https" and port_s == 443)
-        if is_default:
-            server_url = f"{scheme}://{host_s}"
-        else:
-            server_url = f"{scheme}://{host_s}:{port_s}"
-        server_based = f"{server_url}{full_path}"
+_build_signing_base_cached = lru_cache(maxsize=1024)(_build_signing_base)
 
-    # base_url + full_path
-    base_url = str(request.base_url).rstrip("/")
-    composed = f"{base_url}{full_path}"
 
-    # Starlette absolute
+def _build_bases(request: Request) -> Tuple[bytes, ...]:
+    """
+    Deterministic set of bases to tolerate tiny differences between how the
+    client builds its URL and how Starlette renders it. Exact base first, then
+    server-tuple, absolute-URL, "//" and Host-header forms (each for the bare
+    path and, behind a proxy, the root_path-prefixed path), then the
+    trailing-slash toggle of each.
+    """
+    server = request.scope.get("server")  # ("testserver", 80)
+    if not (isinstance(server, tuple) and len(server) == 2 and server[0]):
+        server = None
     url_abs = str(request.url)
+    host = request.headers.get("host")
+    build = _bases_from_parts_cached
+    if len(url_abs) + len(host or "") > _BASES_CACHE_MAX_LEN:
+        build = _bases_from_parts
+    return build(
+        request.method.upper(),
+        request.url.scheme or "http",
+        request.url.path,
+        request.scope.get("root_path") or "",
+        str(request.base_url),
+        url_abs,
+        server,
+        host,
+    )
+
+
+def _bases_from_parts(
+    method: str,
+    scheme: str,
+    path: str,                      # "/objects"
+    root_path: str,
+    raw_base: str,                  # str(request.base_url), ends with "/"
+    url_abs: str,                   # str(request.url)
+    server: Optional[Tuple[str, Optional[int]]],
+    host: Optional[str],            # "testserver" or "testserver:80"
+) -> Tuple[bytes, ...]:
+    """
+    _build_bases on plain strings. Pure, so repeat requests to the same URL
+    share one cached tuple (_bases_from_parts_cached) instead of rebuilding it.
+    """
+    paths = [path] if not root_path else list(dict.fromkeys([path, f"{root_path}{path}"]))
+    base_url = raw_base.rstrip("/")                            # "http://testserver"
 
-    # raw base_url (ends with "/") + full_path -> covers possible "//"
-    raw_base_url = str(request.base_url)
-    double_slash = f"{raw_base_url}{full_path}"
-
-    bases_str: List[str] = []
-    if server_based:
-        bases_str.append(f"{method} {server_based}")
-    bases_str.extend([
-        f"{method} {composed}",
-        f"{method} {url_abs}",
-        f"{method} {double_slash}",
-    ])
+    # server-tuple based (mirrors TestClient precisely)
+    server_url: Optional[str] = None
+    if server is not None:
+        host_s, port_s = server
+        is_default = (scheme == "http" and (port_s in (80, None))) or (scheme == "https" and port_s == 443)
+        server_url = f"{scheme}://{host_s}" if is_default else f"{scheme}://{host_s}:{port_s}"
 
     # Host header variants (+ default-port normalization)
-    host = request.headers.get("host")
+    host_origins: List[str] = []
     if host:
-        host_url = f"{scheme}://{host}"
-        host_comp = f"{host_url}{full_path}"
-        bases_str.append(f"{method} {host_comp}")
+        host_origins.append(f"{scheme}://{host}")
         if (scheme == "http" and host.endswith(":80")) or (scheme == "https" and host.endswith(":443")):
-            host_portless = host.rsplit(":", 1)[0]
-            bases_str.append(f"{method} {scheme}://{host_portless}{full_path}")
+            host_origins.append(f"{scheme}://{host.rsplit(':', 1)[0]}")
         if ":" not in host:
             if scheme == "http":
-                bases_str.append(f"{method} http://{host}:80{full_path}")
+                host_origins.append(f"http://{host}:80")
             elif scheme == "https":
-                bases_str.append(f"{method} https://{host}:443{full_path}")
-
-    # trailing-slash tolerance
-    seen: Set[str] = set()
-    i = 0
-    while i < len(bases_str):
-        s = bases_str[i]
-        if s not in seen:
-            seen.add(s)
-            alt = s.rstrip("/") if s.endswith("/") else s + "/"
-            if alt not in seen:
-                bases_str.append(alt)
-                seen.add(alt)
-        i += 1
-
-    if os.getenv("OMP_SIG_DEBUG") == "1":
-        try:
-            print("CANDIDATE BASES:", bases_str)
-        except Exception:
-            pass
+                host_origins.append(f"https://{host}:443")
+
+    # Assemble as bytes: "METHOD " prefix, each origin and each path are
+    # encoded once and joined by concatenation.
+    prefix = f"{method} ".encode("utf-8")
+    path_b = [p.encode("utf-8") for p in paths]
+    lead = [base_url] if not server_url else [base_url, server_url]
+    trail = [raw_base, *host_origins]                          # raw_base => possible "//"
+    encoded = [prefix + o.encode("utf-8") + p for o in lead for p in path_b]
+    encoded.append(prefix + url_abs.encode("utf-8"))           # Starlette absolute
+    encoded.extend(prefix + o.encode("utf-8") + p for o in trail for p in path_b)
 
-    return [b.encode("utf-8") for b in bases_str]
+    # trailing-slash tolerance; dict.fromkeys dedups in one ordered pass
+    toggled = [b.rstrip(b"/") if b.endswith(b"/") else b + b"/" for b in encoded]
+    return tuple(dict.fromkeys(encoded + toggled))
+
+
+_bases_from_parts_cached = lru_cache(maxsize=1024)(_bases_from_parts)
+
+
+def _candidate_bases(request: Request) -> Tuple[bytes, ...]:
+    """
+    Encoded candidate bases for this request, looked up once and kept on
+    request.state so every verification path (v0, general, batch) shares them.
+    """
+    state = request.state
+    bases = getattr(state, "_omp_sig_bases", None)
+    if bases is None:
+        bases = state._omp_sig_bases = _build_bases(request)
+        if settings.SIG_DEBUG:
+            try:
+                print("CANDIDATE BASES:", [b.decode("utf-8") for b in bases])
+            except Exception:
+                pass
+    return bases
+
+
+def _iter_bases(request: Request) -> Iterator[bytes]:
+    """
+    Exact base first; the full candidate list is only built (and cached) if
+    that one does not verify, which is the rare case.
+    """
+    primary = build_signing_base(request)
+    yield primary
+    for b in _candidate_bases(request):
+        if b != primary:
+            yield b
+
+
+# Headers the dependency needs, read straight from the ASGI scope in one pass
+# (ASGI header names are already lowercase; first occurrence wins, as with
+# request.headers.get).
+_SIG_HEADER_NAMES = frozenset({b"signature-input", b"signature", b"omp-batch-root", b"omp-batch-proof"})
+
+
+def _find_sig_headers(scope: Dict[str, Any]) -> Dict[bytes, str]:
+    found: Dict[bytes, str] = {}
+    for k, v in scope.get("headers") or ():
+        if k in _SIG_HEADER_NAMES and k not in found:
+            found[k] = v.decode("latin-1")
+    return found
 
 
 # -----------------------------------------------------------------------------
 # Mode handling (public API must remain)
 # -----------------------------------------------------------------------------
 
-_SIGNATURE_MODE = "off"  # in-memory default; env overrides if set
-
 def set_signature_mode(mode: str) -> None:
     """
     Set verification mode for this process AND mirror it to the environment
     so any duplicate module import (e.g., via router vs. tests) sees it too.
     """
-    global _SIGNATURE_MODE
     m = (mode or "off").strip().lower()
     os.environ["OMP_SIG_MODE"] = m
-    _SIGNATURE_MODE = m
+    settings.SIG_MODE = m
 
 def get_signature_mode() -> str:
-    m = os.getenv("OMP_SIG_MODE")
-    if m:
-        return m.strip().lower()
-    return _SIGNATURE_MODE
+    # Resolved once in settings (OMP_SIG_MODE, default "off"); changed only by
+    # set_signature_mode or settings.refresh_env_cache().
+    return settings.SIG_MODE
 
 # -----------------------------------------------------------------------------
 # Errors
@@ -147,19 +218,45 @@ class MalformedSignature(ValueError):
 _key_registry: Dict[str, bytes] = {}  # test-only registry
 
 
-def _b64url_decode(s: str) -> bytes:
-    s = (s or "").strip().replace(" ", "")
-    pad = "=" * (-len(s) % 4)
-    return base64.urlsafe_b64decode(s + pad)
-
-
-def _b64std_decode(s: str) -> bytes:
-    s = (s or "").strip().replace(" ", "")
-    pad = "=" * (-len(s) % 4)
-    return base64.b64decode(s + pad)
+def b64url_decode(s: str) -> bytes:
+    """base64url text, padding optional -> bytes (binascii.Error if invalid)."""
+    s = (s or "").strip()
+    if " " in s:  # rare: only copy when there is something to drop
+        s = s.replace(" ", "")
+    return _b64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
+
+
+def b64std_decode(s: str) -> bytes:
+    """Standard base64 text, padding optional -> bytes (binascii.Error if invalid)."""
+    s = (s or "").strip()
+    if " " in s:
+        s = s.replace(" ", "")
+    return _b64.b64decode(s + "=" * (-len(s) % 4))
+
+
+# A 32B Ed25519 key is 64 hex chars or 43/44 base64 chars (padded or not);
+# the length picks the one decoder worth trying and a charset check up front
+# means that decoder cannot raise.
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+_B64_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/-_")
+_KEY_HEX_LEN = 64
+_KEY_B64_LEN = 43  # unpadded; a single "=" may follow
+
+
+def _key_from_text(text: str) -> Optional[bytes]:
+    """hex | base64url | base64 text -> raw 32B key, or None. Never raises."""
+    s = text.strip().replace(" ", "")
+    n = len(s)
+    if n == _KEY_HEX_LEN:
+        return bytes.fromhex(s) if _HEX_CHARS.issuperset(s) else None
+    if n == _KEY_B64_LEN or (n == _KEY_B64_LEN + 1 and s[-1] == "="):
+        # the urlsafe decoder also accepts the standard "+/" alphabet
+        if _B64_CHARS.issuperset(s[:_KEY_B64_LEN]):
+            return _b64.urlsafe_b64decode(s[:_KEY_B64_LEN] + "=")
+    return None
 
 
-def _as_verify_key_bytes(v: Any) -> bytes:
+def as_verify_key_bytes(v: Any) -> bytes:
     """Accept VerifyKey, raw bytes, hex, base64url/base64 -> raw 32B."""
     if v is None:
         raise ValueError("no key")
@@ -171,76 +268,49 @@ def _as_verify_key_bytes(v: Any) -> bytes:
         if len(v) == 32:
             return bytes(v)
     if isinstance(v, str):
-        s = v.strip()
-        # hex
-        try:
-            b = bytes.fromhex(s)
-            if len(b) == 32:
-                return b
-        except Exception:
-            pass
-        # base64url
-        try:
-            pad = "=" * (-len(s) % 4)
-            b = base64.urlsafe_b64decode(s + pad)
-            if len(b) == 32:
-                return b
-        except Exception:
-            pass
-        # base64
-        try:
-            pad = "=" * (-len(s) % 4)
-            b = base64.b64decode(s + pad)
-            if len(b) == 32:
-                return b
-        except Exception:
-            pass
+        b = _key_from_text(v)
+        if b is not None:
+            return b
     raise ValueError("unsupported public key format")
 
 
+@lru_cache(maxsize=256)
+def _decode_env_pub(val: str) -> Optional[bytes]:
+    """
+    Env value (b64url | b64 | hex) -> raw 32B key, or None. Cached on the raw
+    value: env vars change rarely, but tests and _publish_test_key rewrite them
+    in place, so the value itself (not a snapshot) is the cache key.
+    """
+    return _key_from_text(val)
+
+
 def _try_env_pub(env_name: str) -> Optional[bytes]:
     val = os.getenv(env_name)
     if not val:
         return None
-    for decoder in (_b64url_decode, _b64std_decode, lambda x: bytes.fromhex(x.strip())):
-        try:
-            raw = decoder(val)
-            if len(raw) == 32:
-                return raw
-        except Exception:
-            continue
-    return None
+    return _decode_env_pub(val)
+
+@lru_cache(maxsize=256)
+def get_verify_key(pub: bytes) -> Optional[VerifyKey]:
+    """VerifyKey for raw 32B `pub`, built once per key; None if invalid."""
+    try:
+        return VerifyKey(pub)
+    except Exception:
+        return None
 
 def _gather_env_pubs_fallback() -> List[bytes]:
     """
     Fallback: scan env for any published test keys.
     - OMP_SIG_PUB* variants (already supported)
     - OMP_SIG_ED25519_PUB (pair with OMP_SIG_KEYID)
+    Decoded, deduplicated keys in env order.
     """
-    pubs: List[bytes] = []
-    seen: Set[bytes] = set()
-
-    def push_decoded(val: str) -> None:
-        for decoder in (_b64url_decode, _b64std_decode, lambda x: bytes.fromhex(x.strip())):
-            try:
-                raw = decoder(val)
-                if len(raw) == 32:
-                    b = bytes(raw)
-                    if b not in seen:
-                        pubs.append(b)
-                        seen.add(b)
-                    return
-            except Exception:
-                continue
-
-    for k, v in os.environ.items():
-        KU = k.upper()
-        if KU.startswith("OMP_SIG_PUB"):              # our usual patterns
-            push_decoded(v)
-        elif KU in ("OMP_SIG_ED25519_PUB",):          # the fixture style you printed
-            push_decoded(v)
-
-    return pubs
+    decoded = (
+        _decode_env_pub(v)
+        for k, v in os.environ.items()
+        if (ku := k.upper()).startswith("OMP_SIG_PUB") or ku == "OMP_SIG_ED25519_PUB"
+    )
+    return list(dict.fromkeys(b for b in decoded if b is not None))
 
 def _publish_test_key(keyid: str, pub: Any) -> None:
     """
@@ -252,13 +322,13 @@ def _publish_test_key(keyid: str, pub: Any) -> None:
 
     b: Optional[bytes] = None
     try:
-        b = _as_verify_key_bytes(pub)  # handles VerifyKey/bytes/hex/base64
+        b = as_verify_key_bytes(pub)  # handles VerifyKey/bytes/hex/base64
     except Exception:
         if isinstance(pub, (bytes, bytearray)) and len(pub) == 32:
             b = bytes(pub)
 
     if not b or len(b) != 32:
-        if os.getenv("OMP_SIG_DEBUG") == "1":
+        if settings.SIG_DEBUG:
             print("_publish_test_key: rejected value for", keyid, type(pub))
         return
 
@@ -266,19 +336,31 @@ def _publish_test_key(keyid: str, pub: Any) -> None:
     _key_registry[keyid] = b
 
     # env mirror (base64url without padding), to survive module duplication
-    enc = base64.urlsafe_b64encode(b).decode("utf-8").rstrip("=")
-    os.environ[f"OMP_SIG_PUB_{keyid}"] = enc
-    os.environ[f"OMP_SIG_PUB_{keyid.upper()}"] = enc
-    os.environ[f"OMP_SIG_PUB_{keyid.lower()}"] = enc
+    enc = base64.urlsafe_b64encode(b).rstrip(b"=").decode("ascii")
+    # as-is/upper/lower spellings, each written once (putenv per write)
+    for kid in dict.fromkeys((keyid, keyid.upper(), keyid.lower())):
+        os.environ[f"OMP_SIG_PUB_{kid}"] = enc
 
     # ALSO mirror a direct pair so another module instance can resolve by keyid
     os.environ["OMP_SIG_KEYID"] = keyid
     os.environ["OMP_SIG_ED25519_PUB"] = enc
 
 
-    if os.getenv("OMP_SIG_DEBUG") == "1":
+    if settings.SIG_DEBUG:
         print(f"_publish_test_key: stored keyid={keyid}, len={len(b)}; registry_ids={list(_key_registry.keys())}")
 
+@lru_cache(maxsize=256)
+def _keyid_env_names(keyid: str) -> Tuple[Tuple[str, ...], str]:
+    """
+    (OMP_SIG_PUB_* / OMP_SIG_PUB_HEX_* names to probe, case-folded keyid) for
+    `keyid`. Only the names are cached; values are still read from os.environ
+    on every lookup, so keys published or changed at runtime are seen at once.
+    """
+    spellings = (keyid, keyid.upper(), keyid.lower())
+    names = dict.fromkeys(f"OMP_SIG_PUB_{infix}{kid}" for infix in ("", "HEX_") for kid in spellings)
+    return tuple(names), keyid.strip().lower()
+
+
 def get_ed25519_pub_by_keyid(keyid: str) -> Optional[bytes]:
     if not keyid:
         return None
@@ -288,21 +370,15 @@ def get_ed25519_pub_by_keyid(keyid: str) -> Optional[bytes]:
         return _key_registry[keyid]
 
     # 1) case-insensitive OMP_SIG_PUB_* and OMP_SIG_PUB_HEX_* patterns
-    for name in (
-        f"OMP_SIG_PUB_{keyid}",
-        f"OMP_SIG_PUB_{keyid.upper()}",
-        f"OMP_SIG_PUB_{keyid.lower()}",
-        f"OMP_SIG_PUB_HEX_{keyid}",
-        f"OMP_SIG_PUB_HEX_{keyid.upper()}",
-        f"OMP_SIG_PUB_HEX_{keyid.lower()}",
-    ):
+    names, folded = _keyid_env_names(keyid)
+    for name in names:
         raw = _try_env_pub(name)
         if raw:
             return raw
 
     # 2) direct pair: OMP_SIG_KEYID/OMP_SIG_ED25519_PUB
     env_kid = os.getenv("OMP_SIG_KEYID")
-    if env_kid and env_kid.strip().lower() == keyid.strip().lower():
+    if env_kid and env_kid.strip().lower() == folded:
         raw = _try_env_pub("OMP_SIG_ED25519_PUB")
         if raw:
             return raw
@@ -314,13 +390,58 @@ def get_ed25519_pub_by_keyid(keyid: str) -> Optional[bytes]:
 # -----------------------------------------------------------------------------
 # Header parsers (v0: only empty component list '()' supported)
 # -----------------------------------------------------------------------------
+#
+# Results are memoized on the raw header string: clients resend identical
+# headers (same key, same signature) across retries and pipelined calls.
+# The returned dicts are shared between callers and must not be mutated.
+# Failed parses are not cached; headers over _PARSE_CACHE_MAX_LEN bypass the
+# cache so oversized input cannot pin memory.
+
+_PARSE_CACHE_MAX_LEN = 1024
+
+# Regex scanners: one match per `label=...` item, tokenized in the C regex
+# engine. A header is taken from the scan only if the items cover it end to
+# end; anything else -- empty items, odd spacing, quoted "," or ";" -- goes to
+# the general parser, which also produces the error messages.
+_SI_ITEM_RE = re.compile(r'\s*([^=,\s]+)\s*=\s*\(\s*\)((?:\s*;\s*[^=;,\s]+\s*=\s*(?:"[^",;]*"|[^;,"\s]*))*)\s*(?:,|\Z)')
+_SI_PARAM_RE = re.compile(r';\s*([^=;,\s]+)\s*=\s*(?:"([^",;]*)"|([^;,"\s]*))')
+_SIG_ITEM_RE = re.compile(r"\s*([^=,\s]+)\s*=\s*:([^,]*):\s*(?:,|\Z)")
+
+
+def _scan_items(item_re: "re.Pattern[str]", header: str) -> Optional[List["re.Match[str]"]]:
+    """Contiguous matches of `item_re` covering all of `header`, or None."""
+    pos = 0
+    items = []
+    for m in item_re.finditer(header):
+        if m.start() != pos:
+            return None
+        items.append(m)
+        pos = m.end()
+    return items if items and pos == len(header) else None
+
 
 def parse_signature_input(header: str) -> Dict[str, Dict[str, str]]:
+    if header and len(header) <= _PARSE_CACHE_MAX_LEN:
+        return _parse_signature_input_cached(header)
+    return _parse_signature_input(header)
+
+
+def parse_signature(header: str) -> Dict[str, str]:
+    if header and len(header) <= _PARSE_CACHE_MAX_LEN:
+        return _parse_signature_cached(header)
+    return _parse_signature(header)
+
+
+def _parse_signature_input(header: str) -> Dict[str, Dict[str, str]]:
+    items = _scan_items(_SI_ITEM_RE, header) if header else None
+    if items is not None:
+        return {m[1]: {k: q or u for k, q, u in _SI_PARAM_RE.findall(m[2])} for m in items}
+
     if not header or "=" not in header:
         raise MalformedSignature("invalid Signature-Input")
 
     out: Dict[str, Dict[str, str]] = {}
-    for part in [p.strip() for p in header.split(",") if p.strip()]:
+    for part in filter(None, map(str.strip, header.split(","))):
         if "=" not in part:
             raise MalformedSignature("invalid item in Signature-Input")
 
@@ -330,7 +451,7 @@ def parse_signature_input(header: str) -> Dict[str, Dict[str, str]]:
             raise MalformedSignature("missing label")
 
         rest = rest.strip()
-        if not rest.startswith("("):
+        if rest[:1] != "(":
             raise MalformedSignature("missing covered components")
         close = rest.find(")")
         if close < 0:
@@ -342,13 +463,13 @@ def parse_signature_input(header: str) -> Dict[str, Dict[str, str]]:
         params_str = rest[close + 1:].strip()
         params: Dict[str, str] = {}
         if params_str:
-            for seg in [s.strip() for s in params_str.split(";") if s.strip()]:
+            for seg in filter(None, map(str.strip, params_str.split(";"))):
                 if "=" not in seg:
                     raise MalformedSignature("invalid param")
                 k, v = seg.split("=", 1)
                 k = k.strip()
                 v = v.strip()
-                if v.startswith('"') and v.endswith('"') and len(v) >= 2:
+                if len(v) >= 2 and v[0] == '"' == v[-1]:
                     v = v[1:-1]
                 params[k] = v
 
@@ -357,11 +478,15 @@ def parse_signature_input(header: str) -> Dict[str, Dict[str, str]]:
     return out
 
 
-def parse_signature(header: str) -> Dict[str, str]:
+def _parse_signature(header: str) -> Dict[str, str]:
+    items = _scan_items(_SIG_ITEM_RE, header) if header else None
+    if items is not None:
+        return {m[1]: m[2] for m in items}
+
     if not header or "=" not in header:
         raise MalformedSignature("invalid Signature")
     out: Dict[str, str] = {}
-    for part in [p.strip() for p in header.split(",") if p.strip()]:
+    for part in filter(None, map(str.strip, header.split(","))):
         if "=" not in part:
             raise MalformedSignature("invalid item in Signature")
         label, rest = part.split("=", 1)
@@ -369,176 +494,111 @@ def parse_signature(header: str) -> Dict[str, str]:
         if not label:
             raise MalformedSignature("missing label")
         rest = rest.strip()
-        if not (rest.startswith(":") and rest.endswith(":")):
+        if not rest[:1] == ":" == rest[-1:]:
             raise MalformedSignature("invalid signature value")
         out[label] = rest[1:-1]
     return out
 
 
-# -----------------------------------------------------------------------------
-# v0 exact-base fast path (used by dependency first)
-# -----------------------------------------------------------------------------
-
-def verify_request_signature_v0(request: Request) -> bool:
-    """
-    Minimal v0 fast path used by tests:
-      - Parse headers (return False on any parse issue).
-      - Use ONLY the declared keyid’s public key (no scan of all keys).
-      - Verify against a tiny set of deterministic base variants:
-        EXACT:  f"{METHOD} {str(request.base_url).rstrip('/')}{request.url.path}"
-        PLUS:   str(request.url), raw_base_url + path (=> possible //),
-                Host header forms with default-port normalization,
-                and trailing-slash tolerance for each.
-    """
-    # 1) Headers
-    sig_input = request.headers.get("signature-input") or request.headers.get("Signature-Input")
-    sig_hdr   = request.headers.get("signature")        or request.headers.get("Signature")
-    if not sig_input or not sig_hdr:
-        return False
-
-    try:
-        si   = parse_signature_input(sig_input)
-        sigs = parse_signature(sig_hdr)
-    except Exception:
-        return False
-
-    common = set(si.keys()) & set(sigs.keys())
-    if not common:
-        return False
-    label = next(iter(common))
-
-    keyid    = si[label].get("keyid")
-    sig_b64u = sigs.get(label)
-    if not keyid or not sig_b64u:
-        return False
+_parse_signature_input_cached = lru_cache(maxsize=1024)(_parse_signature_input)
+_parse_signature_cached = lru_cache(maxsize=1024)(_parse_signature)
 
-    # 2) Decode signature
-    try:
-        sig_bytes = _b64url_decode(sig_b64u)
-    except Exception:
-        return False
 
-    # 3) ONLY the declared keyid’s public key
-    pub = get_ed25519_pub_by_keyid(keyid)
-    if not pub or not isinstance(pub, (bytes, bytearray)) or len(pub) != 32:
-        return False
+# -----------------------------------------------------------------------------
+# General verification (exception style)
+# -----------------------------------------------------------------------------
 
-    # 4) Candidate bases (exact first)
-    method    = request.method.upper()
-    base_url  = str(request.base_url).rstrip("/")          # "http://testserver"
-    raw_base  = str(request.base_url)                      # ends with "/"
-    path      = request.url.path                           # "/objects"
-    exact     = f"{method} {base_url}{path}"
-    dblslash  = f"{method} {raw_base}{path}"               # "http://testserver//objects"
-    url_abs   = f"{method} {str(request.url)}"             # full absolute URL
+# Opt-in cache of recent successful verifications: (public key, signature) ->
+# (matched base, expiry). A repeat of the same signed request within the TTL
+# skips Ed25519 entirely. This widens the replay window to the TTL, so it is
+# off unless OMP_SIG_CACHE_VERIFY=1; OMP_SIG_CACHE_VERIFY_TTL sets the seconds.
+_VERIFY_CACHE_SIZE = 1024
+_verified_sigs: "OrderedDict[Tuple[bytes, bytes], Tuple[bytes, float]]" = OrderedDict()
 
-    scheme = request.url.scheme or "http"
-    host   = request.headers.get("host")                   # "testserver" or "testserver:80"
 
-    bases_str: List[str] = [exact, url_abs, dblslash]
+def _cached_match(pub: bytes, sig: bytes) -> Optional[bytes]:
+    hit = _verified_sigs.get((pub, sig))
+    if hit is None:
+        return None
+    base, expires = hit
+    if expires < time.monotonic():
+        _verified_sigs.pop((pub, sig), None)
+        return None
+    return base
 
-    if host:
-        host_url  = f"{scheme}://{host}"
-        bases_str.append(f"{method} {host_url}{path}")
 
-        # default-port normalization
-        if (scheme == "http" and host.endswith(":80")) or (scheme == "https" and host.endswith(":443")):
-            host_portless = host.rsplit(":", 1)[0]
-            bases_str.append(f"{method} {scheme}://{host_portless}{path}")
+def _remember_match(pub: bytes, sig: bytes, base: bytes) -> None:
+    _verified_sigs[(pub, sig)] = (base, time.monotonic() + settings.SIG_CACHE_VERIFY_TTL)
+    _verified_sigs.move_to_end((pub, sig))
+    while len(_verified_sigs) > _VERIFY_CACHE_SIZE:
+        _verified_sigs.popitem(last=False)
 
-        # explicit default port if none present
-        if ":" not in host:
-            if scheme == "http":
-                bases_str.append(f"{method} http://{host}:80{path}")
-            elif scheme == "https":
-                bases_str.append(f"{method} https://{host}:443{path}")
-
-    # trailing-slash tolerance
-    seen: Set[str] = set()
-    i = 0
-    while i < len(bases_str):
-        s = bases_str[i]
-        if s not in seen:
-            seen.add(s)
-            alt = s.rstrip("/") if s.endswith("/") else s + "/"
-            if alt not in seen:
-                bases_str.append(alt)
-                seen.add(alt)
-        i += 1
-
-    bases = [b.encode("utf-8") for b in bases_str]
-
-    # 5) Verify
-    try:
-        vk = VerifyKey(bytes(pub))
-    except Exception:
-        return False
 
-    for b in bases:
+def _verify_sweep(pub: bytes, bases: Iterable[bytes], sig: bytes) -> Optional[bytes]:
+    """
+    The single Ed25519 loop for request signatures: first base in `bases`
+    that `sig` verifies under `pub`, or None. Stops at the first match.
+    """
+    vk = get_verify_key(pub)
+    if vk is None:
+        return None
+    if settings.SIG_CACHE_VERIFY:
+        cached = _cached_match(pub, sig)
+        if cached is not None:
+            bases = list(bases)
+            if cached in bases:
+                return cached
+    verify = vk.verify
+    for base in bases:
         try:
-            vk.verify(b, sig_bytes)
-            return True
+            verify(base, sig)
         except (BadSignatureError, NaClValueError, NaClTypeError):
             continue
+        if settings.SIG_CACHE_VERIFY:
+            _remember_match(pub, sig, base)
+        return base
+    return None
 
-    return False
-
-# -----------------------------------------------------------------------------
-# General verification (exception style)
-# -----------------------------------------------------------------------------
 
-def _verify_one(request: Request, keyid: str, sig_b64u: str) -> bool:
+def _verify_core(request: Request, keyid: str, sig_b64u: str) -> bool:
+    """
+    One label's signature: ONLY the declared keyid's public key (no
+    registry/env scan), exact base first, then the shared candidate variants.
+    """
     # decode signature
     try:
-        sig_bytes = _b64url_decode(sig_b64u)
+        sig_bytes = b64url_decode(sig_b64u)
     except (binascii.Error, ValueError):
         return False
 
-    # ONLY the declared keyid (no registry/env scan)
     pub = get_ed25519_pub_by_keyid(keyid)
     if not pub or not isinstance(pub, (bytes, bytearray)) or len(pub) != 32:
-        if os.getenv("OMP_SIG_DEBUG") == "1":
-            print(f"_verify_one: no pub for keyid={keyid!r}")
+        if settings.SIG_DEBUG:
+            print(f"_verify_core: no pub for keyid={keyid!r}")
         return False
 
-    try:
-        vk = VerifyKey(bytes(pub))
-    except Exception:
+    matched = _verify_sweep(bytes(pub), _iter_bases(request), sig_bytes)
+    if matched is None:
         return False
-
-    bases = list(_candidate_bases(request))
-    if os.getenv("OMP_SIG_DEBUG") == "1":
+    if settings.SIG_DEBUG:
         try:
-            print("CANDIDATE BASES:", [b.decode("utf-8") for b in bases])
+            print("MATCHED:", matched.decode("utf-8"))
         except Exception:
             pass
-
-    for base in bases:
-        try:
-            vk.verify(base, sig_bytes)
-            return True
-        except (BadSignatureError, NaClValueError, NaClTypeError):
-            continue
-    return False
+    return True
 
 # -----------------------------------------------------------------------------
-# Route-level boolean helper (optional)
+# v0 exact-base fast path (used by dependency first)
 # -----------------------------------------------------------------------------
 
 def verify_request_signature_v0(request: Request) -> bool:
     """
-    Minimal v0 fast path used by tests:
-      - Parse headers (return False on any parse issue).
-      - Use ONLY the declared keyid’s public key (no scan of all keys).
-      - Verify against a tiny set of deterministic base variants:
-        EXACT:  f"{METHOD} {str(request.base_url).rstrip('/')}{request.url.path}"
-        PLUS:   str(request.url), raw_base_url + path (=> possible //),
-                Host header forms with default-port normalization,
-                and trailing-slash tolerance for each.
+    Minimal v0 fast path used by tests: parse headers (False on any parse
+    issue), pick one label present in both, and verify it via _verify_core.
     """
-    # 1) Headers
-    sig_input = request.headers.get("signature-input") or request.headers.get("Signature-Input")
-    sig_hdr   = request.headers.get("signature")        or request.headers.get("Signature")
+    hdrs = _find_sig_headers(request.scope)
+    sig_input = hdrs.get(b"signature-input")
+    sig_hdr   = hdrs.get(b"signature")
     if not sig_input or not sig_hdr:
         return False
 
@@ -548,6 +608,11 @@ def verify_request_signature_v0(request: Request) -> bool:
     except Exception:
         return False
 
+    return _verify_parsed_v0(request, si, sigs)
+
+
+def _verify_parsed_v0(request: Request, si: Dict[str, Dict[str, str]], sigs: Dict[str, str]) -> bool:
+    """verify_request_signature_v0 on already-parsed headers."""
     common = set(si.keys()) & set(sigs.keys())
     if not common:
         return False
@@ -558,90 +623,7 @@ def verify_request_signature_v0(request: Request) -> bool:
     if not keyid or not sig_b64u:
         return False
 
-    # 2) Decode signature
-    try:
-        sig_bytes = _b64url_decode(sig_b64u)
-    except Exception:
-        return False
-
-    # 3) ONLY the declared keyid’s public key
-    pub = get_ed25519_pub_by_keyid(keyid)
-    if os.getenv("OMP_SIG_DEBUG") == "1":
-        print(f"V0 keyid={keyid!r}; pub_len={len(pub) if isinstance(pub,(bytes,bytearray)) else None}")
-
-    if not pub or not isinstance(pub, (bytes, bytearray)) or len(pub) != 32:
-        return False
-
-    # 4) Candidate bases (exact first)
-    method    = request.method.upper()
-    base_url  = str(request.base_url).rstrip("/")          # "http://testserver"
-    raw_base  = str(request.base_url)                      # ends with "/"
-    path      = request.url.path                           # "/objects"
-    exact     = f"{method} {base_url}{path}"
-    dblslash  = f"{method} {raw_base}{path}"               # "http://testserver//objects"
-    url_abs   = f"{method} {str(request.url)}"             # full absolute URL
-
-    scheme = request.url.scheme or "http"
-    host   = request.headers.get("host")                   # "testserver" or "testserver:80"
-
-    bases_str: List[str] = [exact, url_abs, dblslash]
-
-    if host:
-        host_url  = f"{scheme}://{host}"
-        bases_str.append(f"{method} {host_url}{path}")
-
-        # default-port normalization
-        if (scheme == "http" and host.endswith(":80")) or (scheme == "https" and host.endswith(":443")):
-            host_portless = host.rsplit(":", 1)[0]
-            bases_str.append(f"{method} {scheme}://{host_portless}{path}")
-
-        # explicit default port if none present
-        if ":" not in host:
-            if scheme == "http":
-                bases_str.append(f"{method} http://{host}:80{path}")
-            elif scheme == "https":
-                bases_str.append(f"{method} https://{host}:443{path}")
-
-    # trailing-slash tolerance
-    seen: Set[str] = set()
-    i = 0
-    while i < len(bases_str):
-        s = bases_str[i]
-        if s not in seen:
-            seen.add(s)
-            alt = s.rstrip("/") if s.endswith("/") else s + "/"
-            if alt not in seen:
-                bases_str.append(alt)
-                seen.add(alt)
-        i += 1
-
-    if os.getenv("OMP_SIG_DEBUG") == "1":
-        try:
-            print("V0 BASES:", bases_str)
-        except Exception:
-            pass
-
-    bases = [b.encode("utf-8") for b in bases_str]
-
-    # 5) Verify
-    try:
-        vk = VerifyKey(bytes(pub))
-    except Exception:
-        return False
-
-    for b in bases:
-        try:
-            vk.verify(b, sig_bytes)
-            if os.getenv("OMP_SIG_DEBUG") == "1":
-                try:
-                    print("V0 MATCHED:", b.decode("utf-8"))
-                except Exception:
-                    pass
-            return True
-        except (BadSignatureError, NaClValueError, NaClTypeError):
-            continue
-
-    return False
+    return _verify_core(request, keyid, sig_b64u)
 
 
 
@@ -652,7 +634,11 @@ def verify_request_signature_v0(request: Request) -> bool:
 def verify_request_signatures(request: Request, sig_input_hdr: str, sig_hdr: str) -> None:
     si = parse_signature_input(sig_input_hdr)  # -> 400 via MalformedSignature
     sigs = parse_signature(sig_hdr)            # -> 400 via MalformedSignature
+    _verify_parsed(request, si, sigs)
+
 
+def _verify_parsed(request: Request, si: Dict[str, Dict[str, str]], sigs: Dict[str, str]) -> None:
+    """verify_request_signatures on already-parsed headers."""
     common: Set[str] = set(si.keys()) & set(sigs.keys())
     if not common:
         raise MalformedSignature("signature label mismatch")
@@ -664,29 +650,182 @@ def verify_request_signatures(request: Request, sig_input_hdr: str, sig_hdr: str
     # accept if ANY label verifies — but each uses ONLY its declared keyid
     for label in common:
         keyid = si[label]["keyid"]
-        if _verify_one(request, keyid, sigs[label]):
+        if _verify_core(request, keyid, sigs[label]):
             return
 
     # unknown key(s) or bad sig(s)
     raise PermissionError("no valid signature")
 
+# -----------------------------------------------------------------------------
+# Batch-root signatures (one Ed25519 verify per batch of pipelined requests)
+# -----------------------------------------------------------------------------
+#
+# A client sending N requests at once builds a Merkle tree over their signing
+# bases and signs only the root. Each request then carries:
+#   OMP-Batch-Root:  :<b64url root>:
+#   OMP-Batch-Proof: i=<leaf index>;n=<leaf count>;h=<b64url sibling>.<b64url sibling>...
+#   Signature-Input / Signature as usual, except the signature covers
+#   BATCH_ROOT_PREFIX + root instead of the request base.
+# Leaves are H(0x00 || base), nodes H(0x01 || left || right), H = BLAKE2b-256.
+# As in RFC 6962, an odd last node is promoted to the next level unchanged
+# (never paired with a copy of itself, so [a, b, c] and [a, b, c, c] have
+# different roots); a proof therefore has no sibling for promoted levels, and
+# the verifier needs the leaf count `n` to know which levels those are.
+# Verified (public key, root) pairs are cached (LRU, positives only), so the
+# rest of a batch costs one hash path each. OMP_SIG_BATCH_CACHE_SIZE=0
+# disables the cache.
+
+BATCH_ROOT_PREFIX = b"omp-batch-root:"
+_BATCH_HASH_LEN = 32
+_BATCH_MAX_DEPTH = 32
+_BATCH_MAX_LEAVES = 1 << _BATCH_MAX_DEPTH
+_verified_roots: "OrderedDict[Tuple[bytes, bytes], None]" = OrderedDict()
+
+
+def _batch_hash(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=_BATCH_HASH_LEN).digest()
+
+
+def merkle_leaf(base: bytes) -> bytes:
+    return _batch_hash(b"\x00" + base)
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    return _batch_hash(b"\x01" + left + right)
+
+
+def _merkle_levels(leaves: List[bytes]) -> List[List[bytes]]:
+    if not leaves:
+        raise ValueError("empty batch")
+    levels = [list(leaves)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        up = [_merkle_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            up.append(level[-1])  # promoted, not duplicated
+        levels.append(up)
+    return levels
+
+
+def merkle_root(leaves: List[bytes]) -> bytes:
+    """Client helper: root over leaf hashes (see merkle_leaf)."""
+    return _merkle_levels(leaves)[-1][0]
+
+
+def merkle_proof(leaves: List[bytes], index: int) -> List[bytes]:
+    """Client helper: sibling hashes from leaf `index` up to the root
+    (promoted levels contribute none)."""
+    path: List[bytes] = []
+    for level in _merkle_levels(leaves)[:-1]:
+        if index ^ 1 < len(level):
+            path.append(level[index ^ 1])
+        index >>= 1
+    return path
+
+
+def _merkle_fold(leaf: bytes, index: int, size: int, path: List[bytes]) -> Optional[bytes]:
+    """Root implied by `leaf` at `index` of a `size`-leaf tree, or None if
+    `path` does not have exactly one sibling per non-promoted level."""
+    h = leaf
+    siblings = iter(path)
+    while size > 1:
+        if index ^ 1 < size:
+            sibling = next(siblings, None)
+            if sibling is None:
+                return None
+            h = _merkle_node(sibling, h) if index & 1 else _merkle_node(h, sibling)
+        index >>= 1
+        size = (size + 1) >> 1
+    return h if next(siblings, None) is None else None
+
+
+def parse_batch_proof(root_hdr: str, proof_hdr: str) -> Tuple[bytes, int, int, List[bytes]]:
+    """OMP-Batch-Root / OMP-Batch-Proof -> (root, index, size, path)."""
+    root_hdr = (root_hdr or "").strip()
+    if len(root_hdr) < 2 or not root_hdr[0] == ":" == root_hdr[-1]:
+        raise MalformedSignature("invalid OMP-Batch-Root")
+    params: Dict[str, str] = {}
+    for seg in filter(None, map(str.strip, (proof_hdr or "").split(";"))):
+        if "=" not in seg:
+            raise MalformedSignature("invalid OMP-Batch-Proof param")
+        k, v = seg.split("=", 1)
+        params[k.strip()] = v.strip()
+    index = params.get("i", "")
+    if not index.isdigit():
+        raise MalformedSignature("invalid OMP-Batch-Proof index")
+    size = params.get("n", "")
+    if not size.isdigit() or not 0 < int(size) <= _BATCH_MAX_LEAVES:
+        raise MalformedSignature("invalid OMP-Batch-Proof size")
+    try:
+        root = b64url_decode(root_hdr[1:-1])
+        path = [b64url_decode(h) for h in params.get("h", "").split(".") if h]
+    except (binascii.Error, ValueError):
+        raise MalformedSignature("invalid batch hash encoding")
+    if len(path) > _BATCH_MAX_DEPTH or any(len(h) != _BATCH_HASH_LEN for h in [root, *path]):
+        raise MalformedSignature("invalid batch hash length")
+    return root, int(index), int(size), path
+
+
+def verify_batch_signature(
+    request: Request,
+    si: Dict[str, Dict[str, str]],
+    sigs: Dict[str, str],
+    root: bytes,
+    index: int,
+    size: int,
+    path: List[bytes],
+) -> None:
+    """Raise PermissionError unless the request is a leaf of a validly signed root."""
+    # 1) hash path first: cheap, and needs no key or signature work
+    if index >= size:
+        raise PermissionError("batch index out of range")
+    if not any(_merkle_fold(merkle_leaf(b), index, size, path) == root for b in _iter_bases(request)):
+        raise PermissionError("request not covered by batch root")
+
+    # 2) root signature, verified once per (public key, root)
+    for label in si.keys() & sigs.keys():
+        pub = get_ed25519_pub_by_keyid(si[label].get("keyid") or "")
+        if not pub:
+            continue
+        cache_key = (bytes(pub), root)
+        if cache_key in _verified_roots:
+            _verified_roots.move_to_end(cache_key)
+            return
+        try:
+            vk = get_verify_key(bytes(pub))
+            if vk is None:
+                continue
+            vk.verify(BATCH_ROOT_PREFIX + root, b64url_decode(sigs[label]))
+        except (binascii.Error, ValueError, BadSignatureError, NaClValueError, NaClTypeError):
+            continue
+        if settings.SIG_BATCH_CACHE_SIZE > 0:
+            _verified_roots[cache_key] = None
+            while len(_verified_roots) > settings.SIG_BATCH_CACHE_SIZE:
+                _verified_roots.popitem(last=False)
+        return
+
+    raise PermissionError("no valid batch signature")
+
 # -----------------------------------------------------------------------------
 # FastAPI dependency (mode-aware)
 # -----------------------------------------------------------------------------
 
-def signature_dependency(request: Request) -> None:
+async def signature_dependency(request: Request) -> None:
     """
     Modes:
       - off:         do nothing
       - permissive:  headers optional. If present -> syntax-only parse (no crypto).
       - strict:      headers required; must verify (>=1 valid). 400 syntax, 401 auth/crypto.
+                     With OMP-Batch-Root/OMP-Batch-Proof, the signature is checked
+                     against the batch root (see verify_batch_signature).
     """
     mode = get_signature_mode()
     if mode == "off":
         return
 
-    sig_input = request.headers.get("signature-input")
-    sig_hdr   = request.headers.get("signature")
+    hdrs = _find_sig_headers(request.scope)
+    sig_input = hdrs.get(b"signature-input")
+    sig_hdr   = hdrs.get(b"signature")
 
     if mode == "permissive":
         if not sig_input and not sig_hdr:
@@ -712,21 +851,35 @@ def signature_dependency(request: Request) -> None:
 
         # IMPORTANT: pre-parse for clean 400 vs 401 before any verification
         try:
-            parse_signature_input(sig_input)
-            parse_signature(sig_hdr)
+            si = parse_signature_input(sig_input)
+            sigs = parse_signature(sig_hdr)
         except MalformedSignature as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         except Exception:
             # any other syntax error
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Malformed signature")
 
-        # Now headers are syntactically valid. Verify crypto.
+        # Batch member: signature covers a Merkle root, not this request
+        batch_root = hdrs.get(b"omp-batch-root")
+        if batch_root is not None:
+            try:
+                root, index, size, path = parse_batch_proof(batch_root, hdrs.get(b"omp-batch-proof", ""))
+            except MalformedSignature as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+            try:
+                verify_batch_signature(request, si, sigs, root, index, size, path)
+            except PermissionError as e:
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+            return
+
+        # Now headers are syntactically valid. Verify crypto on the parsed
+        # headers; neither verifier re-parses them.
         try:
             # v0 exact-base fast path
-            if verify_request_signature_v0(request):
+            if _verify_parsed_v0(request, si, sigs):
                 return
             # general verifier (multi-sig, variants) – raises PermissionError if none verify
-            verify_request_signatures(request, sig_input, sig_hdr)
+            _verify_parsed(request, si, sigs)
         except PermissionError as e:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
         except Exception:
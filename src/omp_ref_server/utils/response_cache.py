@@ -0,0 +1,44 @@
+# src/omp_ref_server/utils/response_cache.py
+"""
+LRU of encoded GET /objects/{id} responses: object_id -> (etag, body bytes).
+
+A cache belongs to one storage adapter instance (its `response_cache`
+attribute), and the adapter discards an id on every update/delete of it.
+Re-selecting the backend therefore starts from an empty cache. maxsize <= 0
+disables caching.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+Entry = Tuple[str, bytes]
+
+
+class ResponseCache:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Entry]" = OrderedDict()
+
+    def get(self, object_id: str) -> Optional[Entry]:
+        hit = self._entries.get(object_id)
+        if hit is not None:
+            self._entries.move_to_end(object_id)
+        return hit
+
+    def put(self, object_id: str, entry: Entry) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[object_id] = entry
+        self._entries.move_to_end(object_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, object_id: str) -> None:
+        self._entries.pop(object_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,40 @@
+# src/omp_ref_server/utils/trigrams.py
+"""
+Trigram inverted index for substring search over short strings (keys).
+
+candidates(needle) returns a superset of the ids whose text contains
+`needle`; callers confirm with `needle in text`. Needles shorter than
+MIN_NEEDLE have no trigrams and must be answered by a scan.
+"""
+from __future__ import annotations
+
+from typing import Dict, Set
+
+MIN_NEEDLE = 3
+
+
+def trigrams(s: str) -> Set[str]:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+class TrigramIndex:
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+
+    def add(self, ident: str, text: str) -> None:
+        for tri in trigrams(text):
+            self._postings.setdefault(tri, set()).add(ident)
+
+    def discard(self, ident: str, text: str) -> None:
+        for tri in trigrams(text):
+            ids = self._postings.get(tri)
+            if ids is not None:
+                ids.discard(ident)
+                if not ids:
+                    del self._postings[tri]
+
+    def candidates(self, needle: str) -> Set[str]:
+        """Ids that have every trigram of `needle` (len >= MIN_NEEDLE)."""
+        # intersect smallest posting list first
+        postings = sorted((self._postings.get(t, set()) for t in trigrams(needle)), key=len)
+        return postings[0].intersection(*postings[1:])
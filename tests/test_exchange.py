@@ -0,0 +1,66 @@
+import base64
+from fastapi.testclient import TestClient
+from nacl.signing import SigningKey
+from omp_ref_server.main import app
+from omp_ref_server.models import OMPEnvelope, SignatureRef
+from omp_ref_server.security.envelopes import canonical_content_hash, canonical_envelope_bytes
+
+client = TestClient(app)
+
+def signed_envelope(sk: SigningKey, content: dict, key_id=None) -> dict:
+    env = OMPEnvelope(
+        created_at="2025-01-01T00:00:00Z",
+        sender={"did": "did:example:a", "public_key": "ed25519:" + base64.b64encode(bytes(sk.verify_key)).decode()},
+        intent="memory.transfer",
+        content=content,
+    )
+    env.content_hash = canonical_content_hash(env)
+    env.signature = SignatureRef(
+        alg="ed25519",
+        sig=base64.b64encode(sk.sign(canonical_envelope_bytes(env)).signature).decode(),
+        key_id=key_id,
+    )
+    return env.model_dump(mode="json")
+
+def test_exchange_verifies_signed_envelope():
+    env = signed_envelope(SigningKey.generate(), {"x": 1})
+    r = client.post("/exchange", json=env)
+    assert r.status_code == 200, r.text
+    assert r.json()["verify"] == {"sig_ok": True, "hash_ok": True}
+
+def test_exchange_batch_preserves_order():
+    sk = SigningKey.generate()
+    good = signed_envelope(sk, {"n": 1})
+    tampered = signed_envelope(sk, {"n": 2})
+    tampered["content"] = {"n": 3}
+    unsigned = {"content": {"n": 4}}
+
+    r = client.post("/exchange/batch", json=[good, tampered, unsigned])
+    assert r.status_code == 200, r.text
+    assert [x["verify"] for x in r.json()] == [
+        {"sig_ok": True, "hash_ok": True},
+        {"sig_ok": False, "hash_ok": False},
+        {"sig_ok": False, "hash_ok": False},
+    ]
+
+
+def test_exchange_non_ascii_content_hash_is_a_mismatch():
+    env = {"content": {"n": 1}, "content_hash": "sha256:\u00e9"}
+    r = client.post("/exchange", json=env)
+    assert r.status_code == 200, r.text
+    assert r.json()["verify"]["hash_ok"] is False
+    r = client.post("/exchange/batch", json=[env])
+    assert r.status_code == 200, r.text
+    assert r.json()[0]["verify"]["hash_ok"] is False
+
+def test_exchange_pinned_key_id_verifies(monkeypatch):
+    sk = SigningKey.generate()
+    monkeypatch.setenv("OMP_SIG_PUB_PINNED_ALICE", bytes(sk.verify_key).hex())
+    r = client.post("/exchange", json=signed_envelope(sk, {"x": 1}, key_id="pinned_alice"))
+    assert r.json()["verify"]["sig_ok"] is True
+
+def test_exchange_unknown_key_id_does_not_fall_back_to_embedded_key():
+    # signed by the embedded sender key, but claiming a key_id nobody pinned
+    r = client.post("/exchange", json=signed_envelope(SigningKey.generate(), {"x": 1}, key_id="unpinned_alice"))
+    assert r.status_code == 200, r.text
+    assert r.json()["verify"] == {"sig_ok": False, "hash_ok": True}
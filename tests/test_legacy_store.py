@@ -0,0 +1,27 @@
+# tests/test_legacy_store.py
+from omp_ref_server.main import LegacyStore
+
+
+def test_search_by_substring_and_lifespan_keeps_insertion_order():
+    store = LegacyStore()
+    store.put("alpha-one", {"v": 1}, "short")
+    store.put("beta", {"v": 2}, "long")
+    store.put("alpha-two", {"v": 3}, "long")
+    store.put("alpha-one", {"v": 4}, "long")  # overwrite keeps position
+
+    assert [r["key"] for r in store.search(contains="alpha")] == ["alpha-one", "alpha-two"]
+    assert [r["key"] for r in store.search(lifespan="long")] == ["alpha-one", "beta", "alpha-two"]
+    assert store.search(lifespan="short") == []
+    assert [r["key"] for r in store.search(contains="be", lifespan="long")] == ["beta"]
+
+    assert store.delete("alpha-two")
+    assert not store.delete("alpha-two")
+    assert [r["key"] for r in store.search(contains="alpha")] == ["alpha-one"]
+    assert [i["key"] for i in store.listing()] == ["alpha-one", "beta"]
+
+
+def test_get_returns_none_for_missing_key():
+    store = LegacyStore()
+    store.put("k", {"v": 1}, "short")
+    assert store.get("k") == {"value": {"v": 1}, "lifespan": "short"}
+    assert store.get("missing") is None
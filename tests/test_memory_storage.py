@@ -0,0 +1,80 @@
+# tests/test_memory_storage.py
+from uuid import UUID
+
+import pytest
+
+from omp_ref_server.infra.memory_storage import MemoryStorage
+
+
+def _seed(store, n, namespace="ns"):
+    return [store.store(namespace, f"k{i}", {"i": i}, {}).id for i in range(n)]
+
+
+def test_list_pages_with_cursor_in_creation_order():
+    store = MemoryStorage()
+    ids = _seed(store, 5)
+
+    first = store.list(limit=2)
+    assert [o.id for o in first.items] == ids[:2]
+
+    second = store.list(limit=2, cursor=first.cursor)
+    assert [o.id for o in second.items] == ids[2:4]
+
+    # the cursor is positional: deleting the last item seen does not break it
+    store.delete(ids[3])
+    rest = store.list(limit=10, cursor=second.cursor)
+    assert [o.id for o in rest.items] == ids[4:]
+    assert rest.cursor is None
+
+
+def test_search_uses_namespace_index_and_tracks_deletes():
+    store = MemoryStorage()
+    a = _seed(store, 3, "a")
+    b = _seed(store, 2, "b")
+
+    assert [o.id for o in store.search(namespace="b").items] == b
+    store.delete(a[1])
+    assert [o.id for o in store.search(namespace="a").items] == [a[0], a[2]]
+    assert [o.id for o in store.list().items] == [a[0], a[2], *b]
+    assert store.search(namespace="missing").count == 0
+
+
+def test_malformed_cursor_is_rejected():
+    store = MemoryStorage()
+    _seed(store, 1)
+    with pytest.raises(ValueError):
+        store.list(cursor="nope")
+
+
+def test_search_key_contains_via_trigram_index():
+    store = MemoryStorage()
+    hit1 = store.store("a", "user-alice", {}, {}).id
+    store.store("a", "user-bob", {}, {})
+    hit2 = store.store("b", "admin-alice", {}, {}).id
+
+    assert [o.id for o in store.search(key_contains="alice").items] == [hit1, hit2]
+    assert [o.id for o in store.search(namespace="b", key_contains="alice").items] == [hit2]
+    page = store.search(key_contains="alice", limit=1)
+    assert [o.id for o in page.items] == [hit1]
+    assert [o.id for o in store.search(key_contains="alice", cursor=page.cursor).items] == [hit2]
+    assert store.search(key_contains="carol").count == 0
+
+    store.delete(hit1)
+    assert [o.id for o in store.search(key_contains="alice").items] == [hit2]
+
+
+def test_update_is_visible_to_get_and_list():
+    store = MemoryStorage()
+    oid = store.store("ns", "k", {"v": 1}, {"m": 1}).id
+
+    out = store.update(oid, {"v": 2}, {"m": 2})
+    assert out.metadata == {"m": 2}
+    assert store.get(oid).content == {"v": 2}
+    assert store.list().items[0].metadata == {"m": 2}
+
+
+def test_ids_are_unique_uuid4_across_pool_refills():
+    store = MemoryStorage()
+    ids = _seed(store, 2100)  # > 2 batches
+    assert len(set(ids)) == len(ids)
+    assert {UUID(i).version for i in ids} == {4}
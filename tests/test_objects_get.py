@@ -19,3 +19,59 @@ def test_get_objects_missing_404():
     g = client.get("/objects/does-not-exist")
     assert g.status_code == 404
 
+
+def test_get_object_etag_and_if_none_match_304():
+    r = client.post("/objects", json={"namespace": "ns-etag", "content": {"v": 1}})
+    oid = r.json()["id"]
+
+    g = client.get(f"/objects/{oid}")
+    assert g.status_code == 200
+    etag = g.headers["etag"]
+
+    cached = client.get(f"/objects/{oid}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    # an update invalidates the cached representation
+    u = client.put(f"/objects/{oid}", json={"content": {"v": 2}})
+    assert u.status_code == 200
+    g2 = client.get(f"/objects/{oid}", headers={"If-None-Match": etag})
+    assert g2.status_code == 200
+    assert g2.json()["content"] == {"v": 2}
+    assert g2.headers["etag"] != etag
+
+
+def test_get_cache_follows_adapter_writes():
+    # the real adapter caches encoded responses; writes made directly on it
+    # (not through this router) must still invalidate them
+    from omp_ref_server.infra.memory_storage import MemoryStorage
+    from api.objects import get_storage
+    from omp_ref_server.main import app
+
+    storage = MemoryStorage()
+    saved = app.dependency_overrides[get_storage]
+    app.dependency_overrides[get_storage] = lambda: storage
+    try:
+        oid = storage.store("ns-cache", None, {"v": 1}, {}).id
+        assert client.get(f"/objects/{oid}").json()["content"] == {"v": 1}
+        assert len(storage.response_cache) == 1
+
+        storage.update(oid, {"v": 2}, {})
+        assert client.get(f"/objects/{oid}").json()["content"] == {"v": 2}
+
+        storage.delete(oid)
+        assert client.get(f"/objects/{oid}").status_code == 404
+    finally:
+        app.dependency_overrides[get_storage] = saved
+
+
+def test_compressed_get_uses_weak_etag():
+    r = client.post("/objects", json={"namespace": "ns-gzip", "content": {"blob": "x" * 4096}})
+    oid = r.json()["id"]
+
+    g = client.get(f"/objects/{oid}", headers={"Accept-Encoding": "gzip"})
+    assert g.headers["content-encoding"] == "gzip"
+    assert g.headers["etag"].startswith('W/"')
+
+    again = client.get(f"/objects/{oid}", headers={"Accept-Encoding": "identity", "If-None-Match": g.headers["etag"]})
+    assert again.status_code == 304
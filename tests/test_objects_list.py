@@ -11,7 +11,7 @@ def test_list_objects_returns_items_and_count():
     lst = client.get("/objects")
     assert lst.status_code == 200, lst.text
     data = lst.json()
-    assert set(data.keys()) == {"count", "items"}
+    assert set(data.keys()) == {"count", "items", "cursor"}
     assert data["count"] >= 3
     assert isinstance(data["items"], list)
     assert all(set(item.keys()) == {"id", "namespace", "key", "created_at", "metadata"} for item in data["items"])
@@ -28,3 +28,13 @@ def test_list_objects_with_limit():
     data = lst.json()
     assert data["count"] == 2
     assert len(data["items"]) == 2
+
+def test_large_list_is_gzipped():
+    for i in range(20):
+        r = client.post("/objects", json={"namespace": "ns-gzip", "content": {"i": i}})
+        assert r.status_code == 201, r.text
+
+    lst = client.get("/objects", params={"limit": 20}, headers={"Accept-Encoding": "gzip"})
+    assert lst.status_code == 200
+    assert lst.headers.get("content-encoding") == "gzip"
+    assert lst.json()["count"] == 20
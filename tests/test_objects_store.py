@@ -14,3 +14,14 @@ def test_post_objects_store_201():
     assert data["namespace"] == "test-ns"
     assert isinstance(data["id"], str) and data["id"]
 
+
+def test_post_objects_fast_ingest(monkeypatch):
+    from omp_ref_server.config import settings
+    monkeypatch.setattr(settings, "FAST_INGEST", True)
+
+    r = client.post("/objects", json={"namespace": "fast", "key": "k1", "content": {"a": 1}})
+    assert r.status_code == 201, r.text
+    assert r.json()["key"] == "k1"
+
+    r = client.post("/objects", json={"namespace": "fast", "content": "not-an-object"})
+    assert r.status_code == 400
@@ -0,0 +1,58 @@
+# tests/test_settings.py
+import os
+
+from omp_ref_server.config import settings
+
+
+def test_refresh_env_cache_picks_up_env_changes(monkeypatch):
+    monkeypatch.setenv("OMP_STORAGE", "Redis")
+    monkeypatch.setenv("OMP_FAST_INGEST", "true")
+    settings.refresh_env_cache()
+    try:
+        assert settings.ENV["OMP_STORAGE"] == "Redis"
+        assert settings.STORAGE_BACKEND_NAME == "redis"
+        assert settings.FAST_INGEST is True
+    finally:
+        monkeypatch.undo()
+        settings.refresh_env_cache()
+    assert settings.FAST_INGEST is False
+
+
+def test_load_env_file_parses_and_keeps_real_env(tmp_path, monkeypatch):
+    f = tmp_path / ".env"
+    f.write_text(
+        "# comment\n"
+        "export OMP_T_A=1\n"
+        "OMP_T_B = \"two words\"\n"
+        "OMP_T_C=x # trailing\n"
+        "OMP_T_D=from-file\n"
+        "not a pair\n"
+    )
+    for k in ("OMP_T_A", "OMP_T_B", "OMP_T_C"):
+        # setenv first so monkeypatch records (and later removes) the key
+        monkeypatch.setenv(k, "")
+        monkeypatch.delenv(k)
+    monkeypatch.setenv("OMP_T_D", "from-env")
+
+    settings.load_env_file(f)
+    settings.load_env_file(tmp_path / "missing.env")  # no-op
+
+    assert os.environ["OMP_T_A"] == "1"
+    assert os.environ["OMP_T_B"] == "two words"
+    assert os.environ["OMP_T_C"] == "x"
+    assert os.environ["OMP_T_D"] == "from-env"
+
+
+def test_refresh_covers_module_level_knobs(monkeypatch):
+    monkeypatch.setenv("OMP_GET_CACHE_SIZE", "7")
+    monkeypatch.setenv("OMP_EXCHANGE_BATCH_MAX", "3")
+    monkeypatch.setenv("OMP_SIG_CACHE_VERIFY", "1")
+    settings.refresh_env_cache()
+    try:
+        assert settings.GET_CACHE_SIZE == 7
+        assert settings.EXCHANGE_BATCH_MAX == 3
+        assert settings.SIG_CACHE_VERIFY is True
+    finally:
+        monkeypatch.undo()
+        settings.refresh_env_cache()
+    assert settings.SIG_CACHE_VERIFY is False
@@ -0,0 +1,93 @@
+# tests/test_signatures_bases.py
+from starlette.requests import Request
+
+from omp_ref_server.security.signatures import _candidate_bases, _iter_bases, build_signing_base
+
+
+def _request(path="/objects", root_path="", host=b"testserver"):
+    return Request({
+        "type": "http",
+        "method": "POST",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "root_path": root_path,
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"host", host)],
+    })
+
+
+def test_exact_base_first_with_slash_and_port_variants():
+    req = _request()
+    bases = _candidate_bases(req)
+    assert bases[0] == build_signing_base(req) == b"POST http://testserver/objects"
+    assert b"POST http://testserver/objects/" in bases
+    assert b"POST http://testserver:80/objects" in bases
+    assert len(bases) == len(set(bases))
+
+
+def test_bases_are_built_once_per_request():
+    req = _request()
+    assert _candidate_bases(req) is _candidate_bases(req)
+
+
+def test_same_url_shares_bases_across_requests():
+    assert _candidate_bases(_request()) is _candidate_bases(_request())
+    assert _candidate_bases(_request("/other")) is not _candidate_bases(_request())
+
+
+def test_exact_match_does_not_build_candidates():
+    req = _request()
+    it = _iter_bases(req)
+    assert next(it) == build_signing_base(req)
+    assert getattr(req.state, "_omp_sig_bases", None) is None
+    rest = list(it)
+    assert build_signing_base(req) not in rest
+    assert len(rest) == len(_candidate_bases(req)) - 1
+
+
+def test_verify_cache_skips_crypto_on_repeat(monkeypatch):
+    from nacl.signing import SigningKey
+    from omp_ref_server.security import signatures as sigmod
+
+    sk = SigningKey.generate()
+    pub, req = bytes(sk.verify_key), _request()
+    sig = sk.sign(build_signing_base(req)).signature
+    monkeypatch.setattr(sigmod.settings, "SIG_CACHE_VERIFY", True)
+    monkeypatch.setattr(sigmod, "_verified_sigs", sigmod.OrderedDict())
+    assert sigmod._verify_sweep(pub, _iter_bases(req), sig) == build_signing_base(req)
+
+    class _Rejecting:  # any crypto call from here on fails
+        def verify(self, base, sig):
+            raise sigmod.BadSignatureError("rejected")
+
+    monkeypatch.setattr(sigmod, "get_verify_key", lambda p: _Rejecting())
+    assert sigmod._verify_sweep(pub, _iter_bases(_request()), sig) == build_signing_base(req)
+    # a cached signature still has to cover this request
+    assert sigmod._verify_sweep(pub, _iter_bases(_request("/other")), sig) is None
+
+
+def test_first_base_is_the_host_header_form():
+    # Starlette renders base_url from Host, so the exact base is the form
+    # clients sign; no other candidate is tried ahead of it
+    req = _request(host=b"api.example:8443")
+    assert next(_iter_bases(req)) == b"POST http://api.example:8443/objects"
+
+
+def test_oversized_urls_bypass_the_bases_cache():
+    from omp_ref_server.security import signatures as sigmod
+
+    before = sigmod._bases_from_parts_cached.cache_info().currsize
+    long_path = "/objects/" + "x" * 8192
+    bases = _candidate_bases(_request(long_path))
+    assert bases[0] == b"POST http://testserver" + long_path.encode()
+    assert sigmod._bases_from_parts_cached.cache_info().currsize == before
+
+
+def test_oversized_urls_bypass_the_signing_base_cache():
+    from omp_ref_server.security import signatures as sigmod
+
+    before = sigmod._build_signing_base_cached.cache_info().currsize
+    long_path = "/objects/" + "y" * 8192
+    assert build_signing_base(_request(long_path)) == b"POST http://testserver" + long_path.encode()
+    assert sigmod._build_signing_base_cached.cache_info().currsize == before
@@ -0,0 +1,94 @@
+import base64
+
+import pytest
+from fastapi.testclient import TestClient
+from nacl.signing import SigningKey
+from omp_ref_server.config import settings
+from omp_ref_server.main import app
+from omp_ref_server.security import signatures
+from omp_ref_server.security.signatures import (
+    BATCH_ROOT_PREFIX,
+    merkle_leaf,
+    merkle_proof,
+    merkle_root,
+)
+
+client = TestClient(app)
+
+def b64u(b: bytes) -> str:
+    return base64.urlsafe_b64encode(b).decode().rstrip("=")
+
+@pytest.fixture
+def sk(monkeypatch):
+    key = SigningKey.generate()
+    # monkeypatch restores the env after each test, so order does not matter
+    monkeypatch.setattr(settings, "SIG_MODE", "strict")
+    monkeypatch.setenv("OMP_SIG_KEYID", "sig1")
+    monkeypatch.setenv("OMP_SIG_ED25519_PUB", b64u(bytes(key.verify_key)))
+    return key
+
+# three distinct requests -> odd leaf count exercises node promotion
+BATCH = [("POST", "/objects"), ("GET", "/objects"), ("GET", "/objects/search")]
+
+def signed_batch(sk):
+    leaves = [merkle_leaf(f"{m} {client.base_url}{p}".encode("utf-8")) for m, p in BATCH]
+    root = merkle_root(leaves)
+    sig = b64u(sk.sign(BATCH_ROOT_PREFIX + root).signature)
+    return leaves, root, sig
+
+def batch_headers(leaves, root, sig, i):
+    return {
+        "Signature-Input": 'sig1=();created=1618884473;keyid="sig1"',
+        "Signature": f"sig1=:{sig}:",
+        "OMP-Batch-Root": f":{b64u(root)}:",
+        "OMP-Batch-Proof": f"i={i};n={len(leaves)};h=" + ".".join(b64u(h) for h in merkle_proof(leaves, i)),
+    }
+
+def test_batch_members_verify_with_one_root_signature(sk):
+    leaves, root, sig = signed_batch(sk)
+    r = client.post("/objects", json={"namespace": "ns", "content": {"x": 1}}, headers=batch_headers(leaves, root, sig, 0))
+    assert r.status_code == 201, r.text
+    assert (bytes(sk.verify_key), root) in signatures._verified_roots
+    assert client.get("/objects", headers=batch_headers(leaves, root, sig, 1)).status_code == 200
+    assert client.get("/objects/search", headers=batch_headers(leaves, root, sig, 2)).status_code == 200
+
+def test_batch_proof_for_other_request_401(sk):
+    leaves, root, sig = signed_batch(sk)
+    # proof for leaf 1 (GET /objects) presented on POST /objects
+    r = client.post("/objects", json={"namespace": "ns", "content": {"x": 1}}, headers=batch_headers(leaves, root, sig, 1))
+    assert r.status_code == 401
+
+def test_batch_bad_root_signature_401(sk):
+    leaves, root, _ = signed_batch(sk)
+    forged = b64u(SigningKey.generate().sign(BATCH_ROOT_PREFIX + root).signature)
+    r = client.get("/objects", headers=batch_headers(leaves, root, forged, 1))
+    assert r.status_code == 401
+
+def test_batch_malformed_proof_400(sk):
+    leaves, root, sig = signed_batch(sk)
+    headers = batch_headers(leaves, root, sig, 1)
+    headers["OMP-Batch-Proof"] = "i=x"
+    assert client.get("/objects", headers=headers).status_code == 400
+
+
+def test_odd_node_is_promoted_not_duplicated():
+    a, b, c = (merkle_leaf(x) for x in (b"a", b"b", b"c"))
+    assert merkle_root([a, b, c]) == signatures._merkle_node(signatures._merkle_node(a, b), c)
+    assert merkle_root([a, b, c]) != merkle_root([a, b, c, c])
+
+
+def test_proofs_fold_to_root_for_every_size():
+    for n in range(1, 10):
+        leaves = [merkle_leaf(bytes([i])) for i in range(n)]
+        root = merkle_root(leaves)
+        for i in range(n):
+            path = merkle_proof(leaves, i)
+            assert signatures._merkle_fold(leaves[i], i, n, path) == root
+            assert signatures._merkle_fold(leaves[i], i, n, path + [root]) is None
+
+
+def test_batch_proof_requires_leaf_count(sk):
+    leaves, root, sig = signed_batch(sk)
+    headers = batch_headers(leaves, root, sig, 1)
+    headers["OMP-Batch-Proof"] = headers["OMP-Batch-Proof"].replace(";n=3", "")
+    assert client.get("/objects", headers=headers).status_code == 400
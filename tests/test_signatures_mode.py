@@ -1,11 +1,11 @@
 from fastapi.testclient import TestClient
 from omp_ref_server.main import app
-import os
+from omp_ref_server.security.signatures import set_signature_mode
 
 client = TestClient(app)
 
 def _set_mode(mode: str):
-    os.environ["OMP_SIG_MODE"] = mode
+    set_signature_mode(mode)
 
 def test_off_mode_allows_calls_without_headers():
     _set_mode("off")
@@ -35,3 +35,20 @@ def test_permissive_mode_passes_on_wellformed_syntax():
     r = client.post("/objects", json={"namespace":"ns","content":{"x":1}}, headers=headers)
     assert r.status_code == 201
 
+
+
+def test_mode_is_cached_until_set_or_refreshed(monkeypatch):
+    from omp_ref_server.config import settings
+    from omp_ref_server.security.signatures import get_signature_mode
+
+    monkeypatch.setenv("OMP_SIG_MODE", "off")
+    try:
+        _set_mode(" Strict ")
+        assert get_signature_mode() == "strict"
+        monkeypatch.setenv("OMP_SIG_MODE", "permissive")
+        assert get_signature_mode() == "strict"  # direct env writes need a refresh
+        settings.refresh_env_cache()
+        assert get_signature_mode() == "permissive"
+    finally:
+        monkeypatch.undo()
+        settings.refresh_env_cache()
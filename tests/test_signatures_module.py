@@ -0,0 +1,16 @@
+# tests/test_signatures_module.py
+import ast
+from collections import Counter
+
+from omp_ref_server.security import signatures
+
+
+def test_no_shadowed_top_level_definitions():
+    with open(signatures.__file__, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    defs = Counter(
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    )
+    assert [name for name, n in defs.items() if n > 1] == []
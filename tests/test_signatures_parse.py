@@ -0,0 +1,63 @@
+# tests/test_signatures_parse.py
+import base64
+
+import pytest
+
+from omp_ref_server.security.signatures import (
+    MalformedSignature,
+    as_verify_key_bytes,
+    get_ed25519_pub_by_keyid,
+    parse_signature,
+    parse_signature_input,
+)
+
+
+def test_single_label_headers():
+    assert parse_signature_input('sig1=();created=1618884473;keyid="sig1"') == {
+        "sig1": {"created": "1618884473", "keyid": "sig1"}
+    }
+    assert parse_signature_input("sig1=()") == {"sig1": {}}
+    assert parse_signature("sig1=:c2lnbmF0dXJl:") == {"sig1": "c2lnbmF0dXJl"}
+
+
+def test_multi_label_and_spacing():
+    assert parse_signature_input('a=();keyid="k1", b=() ; keyid = k2') == {
+        "a": {"keyid": "k1"},
+        "b": {"keyid": "k2"},
+    }
+    assert parse_signature("a=:x:, b = :y:") == {"a": "x", "b": "y"}
+
+
+@pytest.mark.parametrize(
+    "header", ["sig1=this is bad", "sig1=(@method)", "=()", "sig1", 'sig1=();keyid="a,b"', 'sig1=();keyid="a;b"']
+)
+def test_malformed_signature_input(header):
+    with pytest.raises(MalformedSignature):
+        parse_signature_input(header)
+
+
+def test_malformed_signature_value():
+    with pytest.raises(MalformedSignature):
+        parse_signature("sig1=not-wrapped")
+
+
+def test_public_key_text_formats():
+    raw = bytes(range(32))
+    b64 = base64.b64encode(raw).decode()
+    for text in (raw.hex(), raw.hex().upper(), b64, b64.rstrip("="),
+                 base64.urlsafe_b64encode(raw).decode().rstrip("=")):
+        assert as_verify_key_bytes(text) == raw
+    for bad in ("", "abc", raw.hex()[:-2], base64.b64encode(raw[:31]).decode(),
+                "g" * 64, "!" * 43, "A" * 42 + "==", "A" * 44):
+        with pytest.raises(ValueError):
+            as_verify_key_bytes(bad)
+
+
+def test_keyid_lookup_sees_env_changes(monkeypatch):
+    raw1, raw2 = bytes(range(32)), bytes(range(1, 33))
+    monkeypatch.setenv("OMP_SIG_PUB_ROTATED", raw1.hex())
+    assert get_ed25519_pub_by_keyid("rotated") == raw1
+    monkeypatch.setenv("OMP_SIG_PUB_ROTATED", raw2.hex())
+    assert get_ed25519_pub_by_keyid("rotated") == raw2
+    monkeypatch.delenv("OMP_SIG_PUB_ROTATED")
+    assert get_ed25519_pub_by_keyid("rotated") is None
@@ -2,7 +2,7 @@ import os, base64
 from fastapi.testclient import TestClient
 from nacl.signing import SigningKey
 from omp_ref_server.main import app
-from omp_ref_server.security.signatures import build_signing_base
+from omp_ref_server.security.signatures import build_signing_base, set_signature_mode
 
 client = TestClient(app)
 
@@ -12,7 +12,7 @@ def b64u(b: bytes) -> str:
 def setup_keys():
     sk = SigningKey.generate()
     vk = sk.verify_key
-    os.environ["OMP_SIG_MODE"] = "strict"
+    set_signature_mode("strict")
     os.environ["OMP_SIG_KEYID"] = "sig1"
     os.environ["OMP_SIG_ED25519_PUB"] = b64u(bytes(vk))
     return sk